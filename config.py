@@ -34,23 +34,47 @@ class DebugConfig:
     # === ENVIRONMENT ===
     FORCE_RESEARCH_ENV = True          # Always use research environment
     
+    # === PERFORMANCE ===
+    DISABLE_JIT = False                # Run numba kernels as plain Python (same as NUMBA_DISABLE_JIT=1)
+    
     @classmethod
     def is_testing_mode(cls):
         """Returns True if any testing flags are enabled"""
-        return (cls.DISABLE_OBSTACLES or cls.DISABLE_GROUND_COLLISION or 
-                cls.DISABLE_OBSTACLE_COLLISION or cls.EMPTY_ENVIRONMENT)
+        return cls._TESTING_MODE
+    
+    @classmethod
+    def refresh_derived_flags(cls):
+        """Recompute flags derived from the settings above (call after changing any of them)"""
+        cls._TESTING_MODE = (cls.DISABLE_OBSTACLES or cls.DISABLE_GROUND_COLLISION or 
+                             cls.DISABLE_OBSTACLE_COLLISION or cls.EMPTY_ENVIRONMENT)
+    
+    @classmethod
+    def force_research_mode(cls):
+        """Apply the research-mode overrides used when the simulator is launched directly"""
+        cls.RESEARCH_MODE = True
+        cls.EMPTY_ENVIRONMENT = True
+        cls.DISABLE_OBSTACLES = True
+        cls.refresh_derived_flags()
+    
+    # Research status banner, joined once so printing it is a single write
+    _RESEARCH_STATUS = "\n".join([
+        "=== EMG FLIGHT CONTROL RESEARCH PLATFORM ===",
+        "Hardware: BioAmp EXG Pill + Arduino Uno R4",
+        "Research Focus: EMG signal validation and flight control",
+        "Environment: Obstacle-free (pure flight dynamics)",
+        "Primary Challenge: Ground collision detection",
+        "Data Collection: EMG signals + flight performance",
+        "Publication Target: HardwareX Journal",
+        "=" * 50,
+    ])
     
     @classmethod
     def print_research_status(cls):
         """Print research configuration status"""
-        print("=== EMG FLIGHT CONTROL RESEARCH PLATFORM ===")
-        print("Hardware: BioAmp EXG Pill + Arduino Uno R4")
-        print("Research Focus: EMG signal validation and flight control")
-        print("Environment: Obstacle-free (pure flight dynamics)")
-        print("Primary Challenge: Ground collision detection")
-        print("Data Collection: EMG signals + flight performance")
-        print("Publication Target: HardwareX Journal")
-        print("=" * 50)
+        print(cls._RESEARCH_STATUS)
+
+# Flags are fixed after import, so derived checks are folded once rather than per call
+DebugConfig.refresh_derived_flags()
 
 
 class PhysicsConfig:
@@ -173,7 +197,7 @@ class DataConfig:
     LOG_PERFORMANCE_METRICS = True   # Log control accuracy, fatigue, etc.
     
     # === FILE FORMATS ===
-    EMG_LOG_FORMAT = "csv"           # CSV for easy analysis
+    EMG_LOG_FORMAT = "csv"           # CSV for analysis tools; "f32" for compact binary records + .meta.json
     REPORT_FORMAT = "json"           # JSON for structured data
     DEBUG_LOG_FORMAT = "txt"         # Text for human reading
     
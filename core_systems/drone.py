@@ -18,7 +18,9 @@ class FPVDrone:
         self.max_speed_kmh = max_speed_kmh
         self.max_range_km = max_range_km
         self.max_speed_ms = max_speed_kmh / 3.6  # Convert to m/s for physics
+        self.max_speed_ms_sq = self.max_speed_ms ** 2  # Squared, for sqrt-free speed checks
         self.max_range_m = max_range_km * 1000   # Convert to meters
+        self.max_range_m_sq = self.max_range_m ** 2  # Squared, for sqrt-free range checks
         
         # FIXED: FPV Racing Drone characteristics - properly balanced for high performance
         self.battery = 100.0
@@ -47,7 +49,7 @@ class FPVDrone:
             return
             
         # Store previous position for distance tracking
-        self.previous_position = Vector3(self.position.x, self.position.y, self.position.z)
+        self.previous_position.set(self.position)
         
         # FIXED: Gravity application - reduced and frame rate independent
         gravity_force = self.gravity * self.dt * 60  # Normalize for 60 FPS
@@ -107,15 +109,16 @@ class FPVDrone:
         # FIXED: Much lower drag for high-speed capability
         # Apply drag with proper frame rate compensation
         drag_factor = pow(self.drag, self.dt * 60)  # Exponential drag decay
-        self.velocity = self.velocity * drag_factor
+        self.velocity *= drag_factor
         
         # FIXED: Speed limiting - allow much higher speeds
-        current_speed = self.velocity.magnitude()
-        if current_speed > self.max_speed_ms:
+        current_speed_sq = self.velocity.magnitude_sq()
+        if current_speed_sq > self.max_speed_ms_sq:
             # Soft speed limiting instead of hard cap
+            current_speed = math.sqrt(current_speed_sq)
             excess_ratio = current_speed / self.max_speed_ms
             if excess_ratio > 1.1:  # Only limit if significantly over
-                self.velocity = self.velocity * (self.max_speed_ms / current_speed)
+                self.velocity *= self.max_speed_ms / current_speed
         
         # ADDED: Speed boost for racing performance at high throttle
         if throttle > 0.8:  # High throttle gives extra performance
@@ -125,12 +128,11 @@ class FPVDrone:
                 0,
                 math.cos(heading_rad)
             )
-            boost_velocity = forward_vector * (throttle * 2.0 * self.dt * 60)
-            self.velocity = self.velocity + boost_velocity
+            forward_vector *= throttle * 2.0 * self.dt * 60
+            self.velocity += forward_vector
             
         # Update position with frame rate compensation
-        position_delta = self.velocity * (self.dt * 60)
-        self.position = self.position + position_delta
+        self.position += self.velocity * (self.dt * 60)
         
         # Track performance metrics
         current_speed_kmh = self.get_speed_kmh()
@@ -138,9 +140,9 @@ class FPVDrone:
             self.max_speed_achieved = current_speed_kmh
             
         # Calculate distance traveled this frame
-        distance_delta = math.sqrt((self.position.x - self.previous_position.x)**2 + 
-                                (self.position.y - self.previous_position.y)**2 + 
-                                (self.position.z - self.previous_position.z)**2)
+        distance_delta = math.hypot(self.position.x - self.previous_position.x,
+                                    self.position.y - self.previous_position.y,
+                                    self.position.z - self.previous_position.z)
         self.total_distance_traveled += distance_delta
         
         # CONFIGURABLE: Battery consumption with debug override
@@ -160,8 +162,8 @@ class FPVDrone:
             activity_multiplier = 1.0 + (control_activity * 2.0)
             
             # Speed power penalty (realistic for racing drones)
-            speed_ratio = current_speed / self.max_speed_ms
-            speed_multiplier = 1.0 + (speed_ratio * speed_ratio * 1.0)  # Quadratic power increase
+            speed_ratio_sq = current_speed_sq / self.max_speed_ms_sq
+            speed_multiplier = 1.0 + (speed_ratio_sq * 1.0)  # Quadratic power increase
             
             # Total power consumption with frame rate compensation
             total_power_drain = base_power_per_frame * activity_multiplier * speed_multiplier * (self.dt * 60)
@@ -169,11 +171,10 @@ class FPVDrone:
         
         # CONFIGURABLE: Range limit enforcement with debug override
         if not DebugConfig.DISABLE_RANGE_LIMITS:
-            distance_from_start = math.sqrt((self.position.x - self.start_position.x)**2 + 
-                                        (self.position.y - self.start_position.y)**2 + 
-                                        (self.position.z - self.start_position.z)**2)
+            distance_from_start_sq = self.get_range_sq_m()
             
-            if distance_from_start > self.max_range_m:
+            if distance_from_start_sq > self.max_range_m_sq:
+                distance_from_start = math.sqrt(distance_from_start_sq)
                 # Soft range limitation - gradual pushback
                 direction_to_start = Vector3(
                     self.start_position.x - self.position.x,
@@ -184,7 +185,7 @@ class FPVDrone:
                 if direction_length > 0:
                     pushback_strength = (distance_from_start - self.max_range_m) / 100.0
                     direction_normalized = direction_to_start * (1.0 / direction_length)
-                    self.velocity = self.velocity + (direction_normalized * pushback_strength)
+                    self.velocity += direction_normalized * pushback_strength
         
         # Ground collision - use unified coordinate system
         if physics_manager.is_ground_collision(self.position.y):
@@ -214,11 +215,19 @@ class FPVDrone:
         speed_ms = self.velocity.magnitude()
         return speed_ms * 3.6  # Convert m/s to km/h
         
+    def get_range_sq_m(self):
+        """Get squared distance from starting position in m^2"""
+        # Plain float multiplies rather than **2, which the interpreter can't specialize
+        dx = self.position.x - self.start_position.x
+        dy = self.position.y - self.start_position.y
+        dz = self.position.z - self.start_position.z
+        return dx*dx + dy*dy + dz*dz
+        
     def get_range_from_start_km(self):
         """Get current distance from starting position in km"""
-        distance_m = math.sqrt((self.position.x - self.start_position.x)**2 + 
-                              (self.position.y - self.start_position.y)**2 + 
-                              (self.position.z - self.start_position.z)**2)
+        distance_m = math.hypot(self.position.x - self.start_position.x,
+                                self.position.y - self.start_position.y,
+                                self.position.z - self.start_position.z)
         return distance_m / 1000.0  # Convert to km
         
     def get_total_distance_km(self):
@@ -0,0 +1,15 @@
+import functools
+import pygame
+
+@functools.lru_cache(maxsize=16)
+def get_font(size):
+    """Default-face font of the given size, shared by every UI that asks for it"""
+    return pygame.font.Font(None, size)
+
+def _clear_fonts_on_quit():
+    """Fonts are invalid after pygame.quit(), so drop them and let a later init rebuild them"""
+    get_font.cache_clear()
+    # pygame forgets its quit callbacks once they have run, so re-arm for the next init
+    pygame.register_quit(_clear_fonts_on_quit)
+
+pygame.register_quit(_clear_fonts_on_quit)
@@ -1,7 +1,9 @@
 import pygame
 import math
 import time
+import functools
 from vector3 import Vector3
+from font_cache import get_font
 
 class FPVHUDSystem:
     def __init__(self, screen_width, screen_height):
@@ -22,10 +24,13 @@ class FPVHUDSystem:
         self.BROWN = (139, 69, 19)  # Ground/earth color
 
         # Fonts
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 32)
-        self.font_small = pygame.font.Font(None, 24)
-        self.font_tiny = pygame.font.Font(None, 18)
+        self.font_large = get_font(48)
+        self.font_medium = get_font(32)
+        self.font_small = get_font(24)
+        self.font_tiny = get_font(18)
+        
+        # Rendered text surfaces keyed by (font, text, color) - most HUD strings repeat
+        self.render_text = functools.lru_cache(maxsize=512)(self._render_text)
         
         # HUD element positions - MOVED ATTITUDE INDICATOR RIGHT
         self.compass_center = (screen_width // 2, 80)
@@ -39,6 +44,51 @@ class FPVHUDSystem:
         self.battery_pos = (50, 50)
         self.range_pos = (screen_width - 200, 50)
         
+        # Fixed HUD geometry (tape pointers, crosshair lines), built once instead of every frame
+        self.tape_width = 60
+        self.tape_height = 200
+        self.speed_pointer = self._tape_pointer(self.speed_pos, self.tape_width, 15)
+        self.altitude_pointer = self._tape_pointer(self.altitude_pos, 0, -15)
+        self.crosshair_segments = self._crosshair_segments()
+        
+        # Range arc tick directions every 2 degrees, clockwise from 12 o'clock
+        self.range_arc_ticks = [
+            (math.cos(math.radians(angle - 90)), math.sin(math.radians(angle - 90)))
+            for angle in range(0, 360, 2)
+        ]
+        
+    def _tape_pointer(self, tape_pos, edge_offset, tip_length):
+        """Triangle pointing at a tape's centre line from its edge"""
+        x, y = tape_pos
+        edge_x = x + edge_offset
+        center_y = y + self.tape_height // 2
+        return [(edge_x, center_y - 8), (edge_x + tip_length, center_y), (edge_x, center_y + 8)]
+    
+    def _crosshair_segments(self):
+        """Line segments for the crosshair and its four corner brackets"""
+        center_x = self.screen_width // 2
+        center_y = self.screen_height // 2
+        crosshair_size = 20
+        bracket_size = 5
+        bracket_distance = 50
+        
+        segments = [
+            ((center_x - crosshair_size, center_y), (center_x + crosshair_size, center_y)),
+            ((center_x, center_y - crosshair_size), (center_x, center_y + crosshair_size)),
+        ]
+        # Each bracket's arms point back towards the centre
+        for sign_x in (-1, 1):
+            for sign_y in (-1, 1):
+                corner_x = center_x + sign_x * bracket_distance
+                corner_y = center_y + sign_y * bracket_distance
+                segments.append(((corner_x, corner_y), (corner_x - sign_x * bracket_size, corner_y)))
+                segments.append(((corner_x, corner_y), (corner_x, corner_y - sign_y * bracket_size)))
+        return segments
+    
+    def _render_text(self, font, text, color):
+        """Render antialiased HUD text (wrapped by the render_text LRU cache)"""
+        return font.render(text, True, color).convert_alpha()
+    
     def draw_compass(self, screen, heading):
         """Draw compass that rotates with heading"""
         center_x, center_y = self.compass_center
@@ -62,7 +112,7 @@ class FPVHUDSystem:
             marker_y = center_y - math.cos(marker_angle) * (self.compass_radius - 15)
             
             # Draw direction marker
-            text = self.font_small.render(label, True, color)
+            text = self.render_text(self.font_small, label, color)
             text_rect = text.get_rect(center=(marker_x, marker_y))
             screen.blit(text, text_rect)
         
@@ -71,7 +121,7 @@ class FPVHUDSystem:
         
         # Heading text
         heading_value = int(heading) % 360
-        heading_text = self.font_medium.render(f"{heading_value:03d}°", True, self.YELLOW)
+        heading_text = self.render_text(self.font_medium, f"{heading_value:03d}°", self.YELLOW)
         heading_rect = heading_text.get_rect(center=(center_x, center_y + self.compass_radius + 20))
         screen.blit(heading_text, heading_rect)
 
@@ -94,11 +144,11 @@ class FPVHUDSystem:
         horizon_y = max(size * 0.1, min(size * 1.9, horizon_y))
         
         # Draw ground portion BELOW horizon line
+        radius_sq = size * size
         for x in range(size * 2):
             for y in range(int(horizon_y), size * 2):
                 # Check if this pixel is within the circle
-                dist = math.sqrt((x - size) ** 2 + (y - size) ** 2)
-                if dist <= size:
+                if (x - size) ** 2 + (y - size) ** 2 <= radius_sq:
                     horizon_surface.set_at((x, y), self.BROWN)
         
         # Draw horizon line
@@ -115,8 +165,7 @@ class FPVHUDSystem:
             
             for x in range(size * 2):
                 for y in range(size * 2):
-                    dist = math.sqrt((x - size) ** 2 + (y - size) ** 2)
-                    if dist <= size:
+                    if (x - size) ** 2 + (y - size) ** 2 <= radius_sq:
                         src_x = x + (rotated_rect.width // 2 - size)
                         src_y = y + (rotated_rect.height // 2 - size)
                         
@@ -137,8 +186,8 @@ class FPVHUDSystem:
     def draw_speed_indicator(self, screen, current_speed, max_speed):
         """Draw vertical speed tape"""
         x, y = self.speed_pos
-        tape_height = 200
-        tape_width = 60
+        tape_height = self.tape_height
+        tape_width = self.tape_width
             
         # Speed tape background
         pygame.draw.rect(screen, (0, 0, 0, 180), (x, y, tape_width, tape_height))
@@ -155,20 +204,16 @@ class FPVHUDSystem:
             if y <= mark_y <= y + tape_height:
                 if speed % 20 == 0:
                     pygame.draw.line(screen, self.WHITE, (x + tape_width - 15, mark_y), (x + tape_width, mark_y), 2)
-                    speed_text = self.font_tiny.render(str(speed), True, self.WHITE)
+                    speed_text = self.render_text(self.font_tiny, str(speed), self.WHITE)
                     screen.blit(speed_text, (x + 5, mark_y - 8))
                 else:
                     pygame.draw.line(screen, self.GRAY, (x + tape_width - 8, mark_y), (x + tape_width, mark_y), 1)
             
             # Current speed indicator
-        pygame.draw.polygon(screen, self.YELLOW, [
-            (x + tape_width, center_y - 8),
-            (x + tape_width + 15, center_y),
-            (x + tape_width, center_y + 8)
-        ])
+        pygame.draw.polygon(screen, self.YELLOW, self.speed_pointer)
             
         # Speed readout
-        speed_text = self.font_medium.render(f"{current_speed:.0f}", True, self.YELLOW)
+        speed_text = self.render_text(self.font_medium, f"{current_speed:.0f}", self.YELLOW)
         speed_bg = pygame.Rect(x + tape_width + 20, center_y - 15, 60, 30)
         pygame.draw.rect(screen, self.BLACK, speed_bg)
         pygame.draw.rect(screen, self.YELLOW, speed_bg, 2)
@@ -177,8 +222,8 @@ class FPVHUDSystem:
     def draw_altitude_indicator(self, screen, altitude):
         """Draw vertical altitude tape"""
         x, y = self.altitude_pos
-        tape_height = 200
-        tape_width = 60
+        tape_height = self.tape_height
+        tape_width = self.tape_width
         
         # Altitude tape background
         pygame.draw.rect(screen, (0, 0, 0, 180), (x, y, tape_width, tape_height))
@@ -195,20 +240,16 @@ class FPVHUDSystem:
             if y <= mark_y <= y + tape_height:
                 if alt % 50 == 0:
                     pygame.draw.line(screen, self.WHITE, (x, mark_y), (x + 15, mark_y), 2)
-                    alt_text = self.font_tiny.render(str(alt), True, self.WHITE)
+                    alt_text = self.render_text(self.font_tiny, str(alt), self.WHITE)
                     screen.blit(alt_text, (x + 20, mark_y - 8))
                 else:
                     pygame.draw.line(screen, self.GRAY, (x, mark_y), (x + 8, mark_y), 1)
         
         # Current altitude indicator
-        pygame.draw.polygon(screen, self.YELLOW, [
-            (x - 15, center_y),
-            (x, center_y - 8),
-            (x, center_y + 8)
-        ])
+        pygame.draw.polygon(screen, self.YELLOW, self.altitude_pointer)
         
         # Altitude readout
-        alt_text = self.font_medium.render(f"{altitude:.0f}m", True, self.YELLOW)
+        alt_text = self.render_text(self.font_medium, f"{altitude:.0f}m", self.YELLOW)
         alt_bg = pygame.Rect(x - 80, center_y - 15, 70, 30)
         pygame.draw.rect(screen, self.BLACK, alt_bg)
         pygame.draw.rect(screen, self.YELLOW, alt_bg, 2)
@@ -231,11 +272,11 @@ class FPVHUDSystem:
             pygame.draw.rect(screen, fill_color, (x + 2, y + 2, fill_width, battery_height - 4))
         
         # Battery percentage text
-        battery_text = self.font_small.render(f"{battery_percentage:.0f}%", True, self.WHITE)
+        battery_text = self.render_text(self.font_small, f"{battery_percentage:.0f}%", self.WHITE)
         screen.blit(battery_text, (x, y + battery_height + 5))
         
         if voltage:
-            voltage_text = self.font_tiny.render(f"{voltage:.1f}V", True, self.GRAY)
+            voltage_text = self.render_text(self.font_tiny, f"{voltage:.1f}V", self.GRAY)
             screen.blit(voltage_text, (x, y + battery_height + 25))
         
     def draw_range_indicator(self, screen, current_range, max_range):
@@ -251,20 +292,20 @@ class FPVHUDSystem:
         if range_percentage > 0:
             arc_color = self.GREEN if range_percentage < 0.7 else self.YELLOW if range_percentage < 0.9 else self.RED
             
-            for angle in range(0, int(fill_angle), 2):
-                angle_rad = math.radians(angle - 90)
-                start_x = x + math.cos(angle_rad) * (circle_radius - 5)
-                start_y = y + math.sin(angle_rad) * (circle_radius - 5)
-                end_x = x + math.cos(angle_rad) * circle_radius
-                end_y = y + math.sin(angle_rad) * circle_radius
+            tick_count = (int(fill_angle) + 1) // 2
+            for cos_a, sin_a in self.range_arc_ticks[:tick_count]:
+                start_x = x + cos_a * (circle_radius - 5)
+                start_y = y + sin_a * (circle_radius - 5)
+                end_x = x + cos_a * circle_radius
+                end_y = y + sin_a * circle_radius
                 pygame.draw.line(screen, arc_color, (start_x, start_y), (end_x, end_y), 3)
         
         # Range text
-        range_text = self.font_small.render(f"{current_range:.1f}km", True, self.WHITE)
+        range_text = self.render_text(self.font_small, f"{current_range:.1f}km", self.WHITE)
         range_rect = range_text.get_rect(center=(x, y))
         screen.blit(range_text, range_rect)
         
-        max_text = self.font_tiny.render(f"/{max_range:.0f}km", True, self.GRAY)
+        max_text = self.render_text(self.font_tiny, f"/{max_range:.0f}km", self.GRAY)
         screen.blit(max_text, (x - 25, y + circle_radius + 10))
         
     def draw_crosshair(self, screen):
@@ -272,42 +313,12 @@ class FPVHUDSystem:
         center_x = self.screen_width // 2
         center_y = self.screen_height // 2
         
-        # Main crosshair
-        crosshair_size = 20
-        pygame.draw.line(screen, self.GREEN, 
-                        (center_x - crosshair_size, center_y), 
-                        (center_x + crosshair_size, center_y), 2)
-        pygame.draw.line(screen, self.GREEN,
-                        (center_x, center_y - crosshair_size),
-                        (center_x, center_y + crosshair_size), 2)
+        # Crosshair lines and corner brackets
+        for start, end in self.crosshair_segments:
+            pygame.draw.line(screen, self.GREEN, start, end, 2)
         
         # Center dot
         pygame.draw.circle(screen, self.GREEN, (center_x, center_y), 3)
-        
-        # Corner brackets
-        bracket_size = 5
-        bracket_distance = 50
-        
-        corners = [
-            (center_x - bracket_distance, center_y - bracket_distance),
-            (center_x + bracket_distance, center_y - bracket_distance),
-            (center_x - bracket_distance, center_y + bracket_distance),
-            (center_x + bracket_distance, center_y + bracket_distance)
-        ]
-        
-        for i, (corner_x, corner_y) in enumerate(corners):
-            if i == 0:  # Top-left
-                pygame.draw.line(screen, self.GREEN, (corner_x, corner_y), (corner_x + bracket_size, corner_y), 2)
-                pygame.draw.line(screen, self.GREEN, (corner_x, corner_y), (corner_x, corner_y + bracket_size), 2)
-            elif i == 1:  # Top-right
-                pygame.draw.line(screen, self.GREEN, (corner_x, corner_y), (corner_x - bracket_size, corner_y), 2)
-                pygame.draw.line(screen, self.GREEN, (corner_x, corner_y), (corner_x, corner_y + bracket_size), 2)
-            elif i == 2:  # Bottom-left
-                pygame.draw.line(screen, self.GREEN, (corner_x, corner_y), (corner_x + bracket_size, corner_y), 2)
-                pygame.draw.line(screen, self.GREEN, (corner_x, corner_y), (corner_x, corner_y - bracket_size), 2)
-            elif i == 3:  # Bottom-right
-                pygame.draw.line(screen, self.GREEN, (corner_x, corner_y), (corner_x - bracket_size, corner_y), 2)
-                pygame.draw.line(screen, self.GREEN, (corner_x, corner_y), (corner_x, corner_y - bracket_size), 2)
     
     def draw_flight_mode_indicator(self, screen, flight_mode, armed_status):
         """Draw flight mode and armed status"""
@@ -315,12 +326,12 @@ class FPVHUDSystem:
         y = self.screen_height - 60
         
         mode_color = self.GREEN if armed_status else self.YELLOW
-        mode_text = self.font_medium.render(f"MODE: {flight_mode}", True, mode_color)
+        mode_text = self.render_text(self.font_medium, f"MODE: {flight_mode}", mode_color)
         screen.blit(mode_text, (x, y))
         
         armed_text = "ARMED" if armed_status else "DISARMED"
         armed_color = self.RED if armed_status else self.GRAY
-        armed_display = self.font_small.render(armed_text, True, armed_color)
+        armed_display = self.render_text(self.font_small, armed_text, armed_color)
         screen.blit(armed_display, (x + 150, y + 5))
         
     def draw_mission_info(self, screen, mission_name, targets_remaining, time_left):
@@ -328,14 +339,14 @@ class FPVHUDSystem:
         x = 20
         y = self.screen_height - 120
         
-        mission_text = self.font_medium.render(f"Mission: {mission_name}", True, self.WHITE)
+        mission_text = self.render_text(self.font_medium, f"Mission: {mission_name}", self.WHITE)
         screen.blit(mission_text, (x, y))
         
-        targets_text = self.font_small.render(f"Checkpoints: {targets_remaining}", True, self.WHITE)
+        targets_text = self.render_text(self.font_small, f"Checkpoints: {targets_remaining}", self.WHITE)
         screen.blit(targets_text, (x, y + 25))
         
         time_color = self.RED if time_left < 10 else self.WHITE
-        time_text = self.font_small.render(f"Time: {time_left:.1f}s", True, time_color)
+        time_text = self.render_text(self.font_small, f"Time: {time_left:.1f}s", time_color)
         screen.blit(time_text, (x, y + 45))
     
     def draw_complete_hud(self, screen, drone_data):
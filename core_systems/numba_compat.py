@@ -0,0 +1,18 @@
+import os
+from config import DebugConfig
+
+# Numba reads NUMBA_DISABLE_JIT at import time, so apply the config flag first
+if DebugConfig.DISABLE_JIT:
+    os.environ.setdefault('NUMBA_DISABLE_JIT', '1')
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback when numba is not installed - run the plain Python function"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
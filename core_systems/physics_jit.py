@@ -0,0 +1,118 @@
+import math
+import numpy as np
+from numba_compat import njit, NUMBA_AVAILABLE
+
+# Pure-float physics helpers compiled with numba when it is available.
+# PhysicsManager delegates to these so results stay identical either way.
+
+@njit(cache=True)
+def altitude_from_world_y(world_y, ground_level):
+    """Convert world Y coordinate to altitude above ground"""
+    return max(0.0, ground_level - world_y)
+
+@njit(cache=True)
+def horizon_position(camera_pitch, camera_altitude, screen_height):
+    """Calculate horizon Y position for ground rendering"""
+    # Base horizon from pitch
+    pitch_offset = int(camera_pitch * 5)
+    
+    # Altitude effect - more dramatic for better visual feedback
+    altitude_factor = camera_altitude / 100.0
+    altitude_offset = int(altitude_factor * 150)
+    
+    # Combined horizon calculation
+    horizon_y = (screen_height // 2) + pitch_offset + altitude_offset
+    
+    # Ensure extreme positions for better altitude visualization
+    if camera_altitude > 400:  # High altitude
+        horizon_y = max(screen_height - 100, horizon_y)
+    elif camera_altitude < 50:  # Very low altitude
+        horizon_y = min(screen_height // 3, horizon_y)
+    
+    # Clamp to reasonable bounds
+    return max(50, min(screen_height - 10, horizon_y))
+
+@njit(cache=True, fastmath=True)
+def camera_basis(yaw_deg, pitch_deg, roll_deg):
+    """Camera right/up/forward axes as a flat 9-tuple (rx, ry, rz, ux, uy, uz, fx, fy, fz)"""
+    yaw_rad = math.radians(yaw_deg)
+    pitch_rad = math.radians(pitch_deg)
+    roll_rad = math.radians(roll_deg)
+    
+    # Forward vector (where camera is looking)
+    fx = math.sin(yaw_rad) * math.cos(pitch_rad)
+    fy = -math.sin(pitch_rad)
+    fz = math.cos(yaw_rad) * math.cos(pitch_rad)
+    
+    # Up vector affected by roll
+    ux = math.sin(roll_rad)
+    uy = math.cos(roll_rad)
+    uz = 0.0
+    
+    # Right vector (cross product)
+    rx = fz * uy - fy * uz
+    ry = fx * uz - fz * ux
+    rz = fy * ux - fx * uy
+    return rx, ry, rz, ux, uy, uz, fx, fy, fz
+
+@njit(cache=True, fastmath=True)
+def project_point_basis(wx, wy, wz, cx, cy, cz, rx, ry, rz, ux, uy, uz, fx, fy, fz,
+                        width, height, focal_length):
+    """Perspective-project one world point against a precomputed camera basis"""
+    # Transform world position to camera space
+    dx = wx - cx
+    dy = wy - cy
+    dz = wz - cz
+    x_cam = dx * rx + dy * ry + dz * rz
+    y_cam = dx * ux + dy * uy + dz * uz
+    z_cam = dx * fx + dy * fy + dz * fz
+    
+    if z_cam <= 0.1:
+        return 0, 0, z_cam
+    
+    screen_x = width // 2 + (x_cam * focal_length / z_cam)
+    screen_y = height // 2 - (y_cam * focal_length / z_cam)
+    return int(screen_x), int(screen_y), z_cam
+
+@njit(cache=True, fastmath=True)
+def project_point(wx, wy, wz, cx, cy, cz, yaw_deg, pitch_deg, roll_deg, width, height, focal_length):
+    """Perspective-project one world point; z_cam <= 0.1 means behind the camera"""
+    rx, ry, rz, ux, uy, uz, fx, fy, fz = camera_basis(yaw_deg, pitch_deg, roll_deg)
+    return project_point_basis(wx, wy, wz, cx, cy, cz, rx, ry, rz, ux, uy, uz, fx, fy, fz,
+                               width, height, focal_length)
+
+@njit(cache=True, fastmath=True)
+def spheres_overlap(x1, y1, z1, x2, y2, z2, radius1, radius2):
+    """3D collision detection between two spheres (squared distances, no sqrt)"""
+    dx = x1 - x2
+    dy = y1 - y2
+    dz = z1 - z2
+    distance_sq = dx*dx + dy*dy + dz*dz
+    radius_sum = radius1 + radius2
+    return distance_sq < radius_sum * radius_sum
+
+@njit(cache=True, fastmath=True)
+def points_within(x1, y1, x2, y2, threshold_distance):
+    """2D distance test between two screen points (squared distances, no sqrt)"""
+    dx = x1 - x2
+    dy = y1 - y2
+    distance_sq = dx*dx + dy*dy
+    return distance_sq < threshold_distance * threshold_distance
+
+@njit(cache=True)
+def target_screen_radii(base_radii, depths):
+    """On-screen radii of targets at the given depths, clamped to 5..50 px"""
+    # Whole-array clamps so the no-numba fallback is a few ufunc calls, not a Python loop
+    distance_scale = np.maximum(0.3, 100.0 / np.maximum(10.0, depths))
+    radii = (base_radii * distance_scale).astype(np.int64)
+    return np.minimum(50, np.maximum(5, radii))
+
+# Compile (or load from the on-disk cache) at import so the first frame doesn't stall
+if NUMBA_AVAILABLE:
+    altitude_from_world_y(0.0, 600.0)
+    horizon_position(0.0, 0.0, 800)
+    project_point_basis(0.0, 0.0, 1.0, 0.0, 0.0, 0.0, *camera_basis(0.0, 0.0, 0.0), 1200, 800, 600.0)
+    project_point(0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1200, 800, 600.0)
+    spheres_overlap(0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0, 1.0)
+    points_within(0.0, 0.0, 1.0, 1.0, 1.0)
+    target_screen_radii(np.zeros(1), np.ones(1))
@@ -1,43 +1,56 @@
 import math
+import numpy as np
 from vector3 import Vector3
+from physics_jit import (altitude_from_world_y, horizon_position, camera_basis,
+                         project_point_basis, spheres_overlap, points_within)
 
 class PhysicsManager:
     """Centralized physics and coordinate system management for FPV drone simulator"""
     
+    # Only screen-dependent values and per-frame camera state live on the instance
+    __slots__ = ('SCREEN_WIDTH', 'SCREEN_HEIGHT', 'HALF_WIDTH', 'HALF_HEIGHT', 'FOCAL_LENGTH',
+                 '_camera_angles', '_camera_basis')
+    
+    # CRITICAL: Unified coordinate system constants
+    GROUND_LEVEL = 600.0  # World Y coordinate where ground is located
+    CRASH_THRESHOLD = 590.0  # Crash slightly above ground
+    FLIGHT_CEILING = 500.0  # Maximum altitude above starting position
+    STARTING_ALTITUDE = 300.0  # Default drone starting Y position
+    
+    # World boundaries
+    WORLD_MIN_X = -400.0
+    WORLD_MAX_X = 1200.0
+    WORLD_MIN_Z = -400.0
+    WORLD_MAX_Z = 400.0
+    
+    # Physics constants (consistent across all systems)
+    GRAVITY = 0.08  # Gravity acceleration per frame at 60 FPS
+    TARGET_FPS = 60.0
+    FRAME_TIME = 1.0 / TARGET_FPS
+    
+    # Projection constants
+    FOV_DEGREES = 90.0
+    FOV_RADIANS = math.radians(FOV_DEGREES)
+    
+    # Collision detection constants
+    COLLISION_TOLERANCE = 25.0  # Base collision radius
+    TARGET_COLLECTION_RADIUS = 30.0  # Base target collection radius
+    
     def __init__(self, screen_width=1200, screen_height=800):
         # Display constants
         self.SCREEN_WIDTH = screen_width
         self.SCREEN_HEIGHT = screen_height
-        
-        # CRITICAL: Unified coordinate system constants
-        self.GROUND_LEVEL = 600.0  # World Y coordinate where ground is located
-        self.CRASH_THRESHOLD = 590.0  # Crash slightly above ground
-        self.FLIGHT_CEILING = 500.0  # Maximum altitude above starting position
-        self.STARTING_ALTITUDE = 300.0  # Default drone starting Y position
-        
-        # World boundaries
-        self.WORLD_MIN_X = -400.0
-        self.WORLD_MAX_X = 1200.0
-        self.WORLD_MIN_Z = -400.0
-        self.WORLD_MAX_Z = 400.0
-        
-        # Physics constants (consistent across all systems)
-        self.GRAVITY = 0.08  # Gravity acceleration per frame at 60 FPS
-        self.TARGET_FPS = 60.0
-        self.FRAME_TIME = 1.0 / self.TARGET_FPS
-        
-        # Projection constants
-        self.FOV_DEGREES = 90.0
-        self.FOV_RADIANS = math.radians(self.FOV_DEGREES)
+        self.HALF_WIDTH = screen_width // 2  # Screen centre, used by every projection
+        self.HALF_HEIGHT = screen_height // 2
         self.FOCAL_LENGTH = self.SCREEN_WIDTH / (2 * math.tan(self.FOV_RADIANS / 2))
         
-        # Collision detection constants
-        self.COLLISION_TOLERANCE = 25.0  # Base collision radius
-        self.TARGET_COLLECTION_RADIUS = 30.0  # Base target collection radius
+        # Camera basis for the last seen rotation, shared by every projection that frame
+        self._camera_angles = None
+        self._camera_basis = None
         
     def get_altitude_from_world_y(self, world_y):
         """Convert world Y coordinate to altitude above ground"""
-        return max(0.0, self.GROUND_LEVEL - world_y)
+        return altitude_from_world_y(world_y, self.GROUND_LEVEL)
     
     def get_world_y_from_altitude(self, altitude):
         """Convert altitude above ground to world Y coordinate"""
@@ -59,116 +72,88 @@ class PhysicsManager:
             max(self.WORLD_MIN_Z, min(self.WORLD_MAX_Z, position.z))
         )
     
+    def begin_frame(self, camera_rotation):
+        """Compute the camera basis once for this frame's projections"""
+        self._camera_angles = (camera_rotation.y, camera_rotation.x, camera_rotation.z)
+        self._camera_basis = camera_basis(*self._camera_angles)
+    
+    def _basis_for(self, camera_rotation):
+        """Cached camera basis, recomputed only when the rotation changes"""
+        if (camera_rotation.y, camera_rotation.x, camera_rotation.z) != self._camera_angles:
+            self.begin_frame(camera_rotation)
+        return self._camera_basis
+    
     def project_3d_to_screen(self, world_pos, camera_pos, camera_rotation):
         """Unified 3D to 2D projection for all systems"""
-        # Calculate camera transform
-        yaw_rad = math.radians(camera_rotation.y)
-        pitch_rad = math.radians(camera_rotation.x)
-        roll_rad = math.radians(camera_rotation.z)
-        
-        # Forward vector (where camera is looking)
-        forward = Vector3(
-            math.sin(yaw_rad) * math.cos(pitch_rad),
-            -math.sin(pitch_rad),
-            math.cos(yaw_rad) * math.cos(pitch_rad)
-        )
-        
-        # Up vector affected by roll
-        up = Vector3(
-            math.sin(roll_rad),
-            math.cos(roll_rad),
-            0
-        )
-        
-        # Right vector (cross product)
-        right = Vector3(
-            forward.z * up.y - forward.y * up.z,
-            forward.x * up.z - forward.z * up.x,
-            forward.y * up.x - forward.x * up.y
-        )
-        
-        # Transform world position to camera space
-        relative_pos = Vector3(
-            world_pos.x - camera_pos.x,
-            world_pos.y - camera_pos.y,
-            world_pos.z - camera_pos.z
+        screen_x, screen_y, z_cam = project_point_basis(
+            world_pos.x, world_pos.y, world_pos.z,
+            camera_pos.x, camera_pos.y, camera_pos.z,
+            *self._basis_for(camera_rotation),
+            self.SCREEN_WIDTH, self.SCREEN_HEIGHT, self.FOCAL_LENGTH
         )
         
-        # Project onto camera's coordinate system
-        x_cam = relative_pos.x * right.x + relative_pos.y * right.y + relative_pos.z * right.z
-        y_cam = relative_pos.x * up.x + relative_pos.y * up.y + relative_pos.z * up.z
-        z_cam = relative_pos.x * forward.x + relative_pos.y * forward.y + relative_pos.z * forward.z
-        
         # Check if behind camera
         if z_cam <= 0.1:
             return None
         
-        # Perspective projection
-        screen_x = self.SCREEN_WIDTH // 2 + (x_cam * self.FOCAL_LENGTH / z_cam)
-        screen_y = self.SCREEN_HEIGHT // 2 - (y_cam * self.FOCAL_LENGTH / z_cam)
+        return screen_x, screen_y, z_cam
+    
+    def project_points_to_screen(self, points, camera_pos, camera_rotation):
+        """Batched project_3d_to_screen over an (N, 3) array of world positions
+        
+        Returns integer screen x/y arrays, camera-space depth, and a mask of
+        points in front of the camera (the rest should be ignored).
+        """
+        # Rows are the camera axes, so one matmul gives (x_cam, y_cam, z_cam) per point
+        basis = np.array(self._basis_for(camera_rotation)).reshape(3, 3)
+        relative = points - camera_pos.as_array()
+        camera_space = relative @ basis.T
+        
+        z_cam = camera_space[:, 2]
+        visible = z_cam > 0.1
+        # One divide per point, shared by both screen axes
+        scale = self.FOCAL_LENGTH / np.where(visible, z_cam, 1.0)
         
-        return int(screen_x), int(screen_y), z_cam
+        screen_x = np.trunc(self.HALF_WIDTH + camera_space[:, 0] * scale)
+        screen_y = np.trunc(self.HALF_HEIGHT - camera_space[:, 1] * scale)
+        
+        return screen_x.astype(int), screen_y.astype(int), z_cam, visible
     
     def project_3d_to_isometric(self, world_pos):
         """Isometric projection for top-down/tactical views"""
-        screen_x = self.SCREEN_WIDTH // 2 + (world_pos.x - world_pos.z * 0.5) * 0.8
-        screen_y = self.SCREEN_HEIGHT // 2 + (world_pos.y + (world_pos.x + world_pos.z) * 0.2) * 0.6
+        screen_x = self.HALF_WIDTH + (world_pos.x - world_pos.z * 0.5) * 0.8
+        screen_y = self.HALF_HEIGHT + (world_pos.y + (world_pos.x + world_pos.z) * 0.2) * 0.6
         return int(screen_x), int(screen_y)
     
     def check_3d_collision(self, pos1, pos2, radius1, radius2):
         """3D collision detection between two objects"""
-        distance = math.sqrt(
-            (pos1.x - pos2.x)**2 + 
-            (pos1.y - pos2.y)**2 + 
-            (pos1.z - pos2.z)**2
-        )
-        return distance < (radius1 + radius2)
+        return spheres_overlap(pos1.x, pos1.y, pos1.z, pos2.x, pos2.y, pos2.z, radius1, radius2)
+    
+    def check_3d_collision_xyz(self, x1, y1, z1, x2, y2, z2, radius1, radius2):
+        """check_3d_collision on raw coordinates, for callers that already hold floats"""
+        return spheres_overlap(x1, y1, z1, x2, y2, z2, radius1, radius2)
     
     def check_screen_space_collision(self, obj1_screen, obj2_screen, threshold_distance):
         """2D screen space collision for FPV view"""
         if obj1_screen is None or obj2_screen is None:
             return False
         
-        screen_distance = math.sqrt(
-            (obj1_screen[0] - obj2_screen[0])**2 + 
-            (obj1_screen[1] - obj2_screen[1])**2
-        )
-        return screen_distance < threshold_distance
+        return points_within(obj1_screen[0], obj1_screen[1], obj2_screen[0], obj2_screen[1],
+                             threshold_distance)
     
     def check_crosshair_alignment(self, screen_pos, tolerance=40):
         """Check if screen position is aligned with center crosshair"""
         if screen_pos is None:
             return False
         
-        center_x = self.SCREEN_WIDTH // 2
-        center_y = self.SCREEN_HEIGHT // 2
+        center_x = self.HALF_WIDTH
+        center_y = self.HALF_HEIGHT
         
-        distance = math.sqrt(
-            (screen_pos[0] - center_x)**2 + 
-            (screen_pos[1] - center_y)**2
-        )
-        return distance < tolerance
+        return points_within(screen_pos[0], screen_pos[1], center_x, center_y, tolerance)
     
     def calculate_horizon_position(self, camera_pitch, camera_altitude):
         """Calculate horizon Y position for ground rendering"""
-        # Base horizon from pitch
-        pitch_offset = int(camera_pitch * 5)
-        
-        # Altitude effect - more dramatic for better visual feedback
-        altitude_factor = camera_altitude / 100.0
-        altitude_offset = int(altitude_factor * 150)
-        
-        # Combined horizon calculation
-        horizon_y = (self.SCREEN_HEIGHT // 2) + pitch_offset + altitude_offset
-        
-        # Ensure extreme positions for better altitude visualization
-        if camera_altitude > 400:  # High altitude
-            horizon_y = max(self.SCREEN_HEIGHT - 100, horizon_y)
-        elif camera_altitude < 50:  # Very low altitude
-            horizon_y = min(self.SCREEN_HEIGHT // 3, horizon_y)
-        
-        # Clamp to reasonable bounds
-        return max(50, min(self.SCREEN_HEIGHT - 10, horizon_y))
+        return horizon_position(float(camera_pitch), float(camera_altitude), self.SCREEN_HEIGHT)
     
     def apply_frame_rate_compensation(self, value, target_fps=None):
         """Apply frame rate compensation to physics values"""
@@ -200,14 +185,15 @@ class CollisionManager:
     
     def check_drone_obstacle_collision(self, drone, obstacles):
         """Check drone collision with obstacles using unified physics"""
+        r = drone.size / 2
+        px, py, pz = drone.position.x, drone.position.y, drone.position.z
         for obstacle in obstacles:
-            # 3D collision check
-            if self.physics.check_3d_collision(
-                drone.position, 
-                obstacle.position,
-                drone.size / 2,
-                max(obstacle.width, obstacle.height, obstacle.depth) / 2
-            ):
+            # Tight AABB test: centre offsets against half-extents grown by the drone radius,
+            # so the empty corners around a box no longer count as hits
+            centre = obstacle.position
+            if (abs(centre.x - px) < obstacle.width / 2 + r and
+                    abs(centre.y - py) < obstacle.height / 2 + r and
+                    abs(centre.z - pz) < obstacle.depth / 2 + r):
                 return obstacle
         return None
     
@@ -215,38 +201,45 @@ class CollisionManager:
         """Check ground collision using unified coordinate system"""
         return self.physics.is_ground_collision(drone.position.y)
     
-    def check_target_collection(self, drone, targets, camera_rotation=None):
-        """Check target collection with both 3D and screen space options"""
-        for target in targets:
-            if target.collected:
-                continue
-            
-            # Primary: 3D proximity check
-            if self.physics.check_3d_collision(
-                drone.position,
-                target.position,
-                drone.size / 2,
-                target.radius
-            ):
-                target.collected = True
-                return target
-            
-            # Secondary: Screen space crosshair alignment (if camera provided)
-            if camera_rotation is not None:
-                target_screen = self.physics.project_3d_to_screen(
-                    target.position, drone.position, camera_rotation
-                )
-                if self.physics.check_crosshair_alignment(target_screen, 50):
-                    # Also check reasonable 3D distance
-                    distance_3d = math.sqrt(
-                        (drone.position.x - target.position.x)**2 + 
-                        (drone.position.y - target.position.y)**2 + 
-                        (drone.position.z - target.position.z)**2
-                    )
-                    if distance_3d < 60:  # Close enough for collection
-                        target.collected = True
-                        return target
+    def check_target_collection(self, drone, targets, camera_rotation=None, candidates=None):
+        """Check target collection with both 3D and screen space options
+        
+        targets is a structure-of-arrays batch (see research_obstacles.TargetBatch);
+        candidates optionally restricts the test to those target indices. All
+        candidates are tested at once and the first hit in scenario order wins.
+        """
+        if candidates is None:
+            candidates = np.arange(len(targets))
+        candidates = candidates[~targets.collected[candidates]]
+        if candidates.size == 0:
+            return None
         
+        positions = targets.positions[candidates]
+        drone_pos = drone.position.as_array()
+        # Squared in place - one temporary for the deltas instead of two
+        delta = positions - drone_pos
+        delta *= delta
+        distance_sq = delta.sum(axis=1)
+        
+        # Primary: 3D proximity check
+        hit = distance_sq < targets.reach_sq(drone.size)[candidates]
+        
+        # Secondary: Screen space crosshair alignment (if camera provided),
+        # only for targets within a reasonable 3D distance
+        if camera_rotation is not None:
+            screen_x, screen_y, _, visible = self.physics.project_points_to_screen(
+                positions, drone.position, camera_rotation
+            )
+            center_x = self.physics.HALF_WIDTH
+            center_y = self.physics.HALF_HEIGHT
+            aligned = (screen_x - center_x) ** 2 + (screen_y - center_y) ** 2 < 50 ** 2
+            hit |= visible & aligned & (distance_sq < 60 ** 2)
+        
+        first = int(np.argmax(hit))
+        if hit[first]:
+            index = int(candidates[first])
+            targets.mark_collected(index)
+            return targets.targets[index]
         return None
 
 # Global instance for easy access
@@ -1,8 +1,13 @@
 from dataclasses import dataclass
 import math
+import numpy as np
+
+# Bound once so magnitude() skips the math attribute lookup on every call
+_hypot = math.hypot
 
 @dataclass
 class Vector3:
+    __slots__ = ('x', 'y', 'z')
     x: float
     y: float
     z: float
@@ -10,8 +15,38 @@ class Vector3:
     def __add__(self, other):
         return Vector3(self.x + other.x, self.y + other.y, self.z + other.z)
     
+    def __sub__(self, other):
+        return Vector3(self.x - other.x, self.y - other.y, self.z - other.z)
+    
     def __mul__(self, scalar):
         return Vector3(self.x * scalar, self.y * scalar, self.z * scalar)
     
+    def __iadd__(self, other):
+        """Add in place - physics updates mutate state vectors instead of reallocating"""
+        self.x += other.x
+        self.y += other.y
+        self.z += other.z
+        return self
+    
+    def __imul__(self, scalar):
+        """Scale in place"""
+        self.x *= scalar
+        self.y *= scalar
+        self.z *= scalar
+        return self
+    
+    def set(self, other):
+        """Copy another vector's components into this one"""
+        self.x, self.y, self.z = other.x, other.y, other.z
+        return self
+    
     def magnitude(self):
-        return math.sqrt(self.x**2 + self.y**2 + self.z**2)
\ No newline at end of file
+        return _hypot(self.x, self.y, self.z)
+    
+    def magnitude_sq(self):
+        """Squared length, for comparisons that don't need the sqrt"""
+        return self.x*self.x + self.y*self.y + self.z*self.z
+    
+    def as_array(self):
+        """Copy into a float64 (3,) array for vectorized math"""
+        return np.array((self.x, self.y, self.z))
@@ -1,11 +1,12 @@
 import sys
 import pygame
 import math
-import random
 import threading
 import time
 import os
 import json
+import functools
+import numpy as np
 from dataclasses import dataclass
 from typing import List, Tuple
 
@@ -19,11 +20,13 @@ from fpv_hud_system import FPVHUDSystem, integrate_hud_with_drone
 from vector3 import Vector3
 from drone import FPVDrone
 from physics_manager import physics_manager, collision_manager
-from research_obstacles import ResearchRenderer, RESEARCH_SCENARIOS, Target
+from research_obstacles import ResearchRenderer, RESEARCH_SCENARIOS, Target, TargetBatch, TargetGrid
 from config import DebugConfig, PhysicsConfig, EMGConfig, UIConfig
 from research_config_ui import ResearchConfigurationUI
 from emg_evaluation_system import EMGEvaluationSystem
 from emg_calibration_ui import EMGCalibrationUI
+from numba_compat import njit
+from font_cache import get_font
 
 # Hardware control toggle
 ARDUINO_MODE = False  # Set to True when Arduino is connected
@@ -35,7 +38,12 @@ if ARDUINO_MODE:
     arduino_port = 'COM3'  # Update for your system
     baud_rate = 115200
     try:
-        ser = serial.Serial(arduino_port, baud_rate, timeout=1)
+        # Short timeout: read() returns whatever is buffered instead of waiting for a full line
+        ser = serial.Serial(arduino_port, baud_rate, timeout=0.01)
+        try:
+            ser.set_low_latency_mode(True)  # Linux USB-serial only
+        except (AttributeError, ValueError, OSError):
+            pass
         print(f"Arduino connected on {arduino_port}")
     except Exception as e:
         print(f"Arduino connection failed: {e}")
@@ -45,23 +53,45 @@ if ARDUINO_MODE:
 emg_signals = [0.0, 0.0, 0.0, 0.0]  # throttle, yaw, pitch, roll
 breaking_case = False
 
+@njit(cache=True)
+def clamp_emg(signals):
+    """Clamp raw EMG samples to the valid Arduino range"""
+    return np.clip(signals, 0.0, 1000.0)
+
+def parse_emg_field(field):
+    """One comma-separated serial field as a float, 0.0 if it isn't a number"""
+    try:
+        return float(field)
+    except ValueError:
+        return 0.0
+
 def arduino_data():
     """Continuously fetch EMG data from Arduino"""
     global emg_signals, breaking_case
+    serial_buffer = bytearray()
     while not breaking_case and ARDUINO_MODE:
         try:
-            if ser and ser.in_waiting > 0:
-                ser_out = ser.readline().decode().strip().split(',')
-                if len(ser_out) == 4:
-                    parsed_signals = []
-                    for signal_str in ser_out:
-                        try:
-                            signal_value = float(signal_str)
-                            signal_value = max(0, min(1000, signal_value))  # Clamp range
-                            parsed_signals.append(signal_value)
-                        except ValueError:
-                            parsed_signals.append(0.0)
-                    emg_signals = parsed_signals
+            if ser:
+                # Read everything waiting in one call and split complete lines ourselves
+                serial_buffer.extend(ser.read(max(1, ser.in_waiting)))
+                line_end = serial_buffer.rfind(b'\n')
+                if line_end < 0:
+                    continue
+                lines = serial_buffer[:line_end].split(b'\n')
+                del serial_buffer[:line_end + 1]
+                
+                for line in lines:
+                    fields = bytes(line).split(b',')
+                    if len(fields) != 4:
+                        continue
+                    try:
+                        # One C-level conversion for the usual all-numeric line
+                        parsed_signals = np.array(fields, dtype=np.float32)
+                    except ValueError:
+                        # Field-by-field so a bad field reads as 0.0 instead of losing the sample
+                        parsed_signals = np.array([parse_emg_field(f) for f in fields], dtype=np.float32)
+                    # clip returns a new array, so readers never see a half-written sample
+                    emg_signals = clamp_emg(parsed_signals).tolist()
         except Exception as e:
             print(f"Arduino error: {e}")
             emg_signals = [0.0, 0.0, 0.0, 0.0]
@@ -74,11 +104,14 @@ if ARDUINO_MODE:
 
 class TrainingScenario:
     """Research scenario class"""
-    def __init__(self, name, description, obstacles, targets, time_limit=180):
+    def __init__(self, name, description, obstacles, targets, time_limit=180, drone_size=0):
         self.name = name
         self.description = description
         self.obstacles = obstacles  # Always empty in research mode
         self.targets = targets      # Optional navigation targets
+        self.target_batch = TargetBatch(targets)
+        self.target_grid = TargetGrid(targets, drone_size / 2)
+        self.targets_remaining = len(targets)  # Decremented as targets are collected
         self.time_limit = time_limit
         self.completed = False
         self.start_time = time.time()
@@ -86,7 +119,7 @@ class TrainingScenario:
     def check_completion(self, drone):
         """Check if research scenario objectives are met"""
         if not DebugConfig.DISABLE_TARGETS:
-            return len([t for t in self.targets if not t.collected]) == 0 and not drone.crashed
+            return self.targets_remaining == 0 and not drone.crashed
         else:
             # In target-free mode, completion is time-based or manual
             return False
@@ -120,6 +153,8 @@ class FPVSimulator:
 
         # EMG evaluation system
         self.emg_evaluation = EMGEvaluationSystem()
+        # Live SNR/crosstalk are only needed when the EMG HUD is shown (or logged - see initialize_logging)
+        self.emg_evaluation.set_analytics_enabled(EMGConfig.SHOW_EMG_SIGNALS and ARDUINO_MODE)
         self.calibration_ui = EMGCalibrationUI(self.WIDTH, self.HEIGHT)
 
         # Load images (optional for research mode)
@@ -132,7 +167,19 @@ class FPVSimulator:
         self.YELLOW = (255, 255, 0)
         
         # Fonts
-        self.font_small = pygame.font.Font(None, 24)
+        self.font_small = get_font(24)
+        self.render_text = functools.lru_cache(maxsize=512)(
+            lambda text, color: self.font_small.render(text, True, color).convert_alpha()
+        )
+        
+        # Pre-rendered sky gradients, one per altitude bucket
+        self.sky_cache = self.build_sky_cache()
+        self.sky_scaled = None
+        self.sky_scaled_key = None
+        
+        # Ground color per whole metre of altitude, and a reusable ground rect
+        self.ground_color_lut = [self.ground_color_for_altitude(alt) for alt in range(512)]
+        self.ground_rect = pygame.Rect(0, 0, self.WIDTH, self.HEIGHT)
         
         # Game state for research workflow
         self.game_state = "CONFIGURATION"  # "CONFIGURATION", "EMG_CALIBRATION", "FLYING"
@@ -142,6 +189,14 @@ class FPVSimulator:
         
         # Research session tracking
         self.research_session_id = time.strftime("%Y%m%d_%H%M%S")
+        self.frame_time = time.time()  # Sampled once per FLYING frame
+        
+        # Reused every frame by draw_hud
+        self.mission_data = {
+            'mission_name': '',
+            'targets_remaining': 0,
+            'time_left': 0.0
+        }
         
         # Simplified configuration (research-focused)
         self.config = {
@@ -160,15 +215,22 @@ class FPVSimulator:
         self.emg_threshold = EMGConfig.NOISE_THRESHOLD
         self.emg_max = EMGConfig.EMG_MAX_VALUE
         
+        # Pre-generated simulated EMG noise for calibration without hardware
+        self.noise_ring_low = np.random.uniform(10, 30, (4096, 4)).astype(np.float32)
+        self.noise_ring_high = np.random.uniform(20, 80, (4096, 4)).astype(np.float32)
+        self.noise_index = 0
+        
         # First-person camera
         self.camera_position = Vector3(0, 0, 0)
         self.camera_rotation = Vector3(0, 0, 0)
         
         # Debug logging
         debug_folder = "data_output/debug_logs"  # Instead of just "data_output"
-        self.debug_file = open(f"{debug_folder}/research_debug_{self.research_session_id}.txt", "w")
+        self.debug_file = open(f"{debug_folder}/research_debug_{self.research_session_id}.txt", "w", buffering=1 << 16)
         self.debug_file.write("Time,Throttle,Yaw,Pitch,Roll,Speed_kmh,Altitude,EMG_Quality,Fatigue_Level\n")
         self.debug_frame_counter = 0
+        self.debug_flush_interval = 2.0  # Seconds between forced flushes
+        self.last_debug_flush = time.time()
 
     def create_data_directories(self):
         """Create directories for organized data storage"""
@@ -195,16 +257,56 @@ class FPVSimulator:
             'ground_texture': 'images/ground_texture.png',
             'checkpoint': 'images/checkpoint.png'
         }
+        transparent_images = {'checkpoint'}
+        
+        # Converting to the display format needs a display surface
+        display_ready = pygame.display.get_surface() is not None
         
         for key, filename in image_files.items():
             try:
                 if os.path.exists(filename):
-                    self.images[key] = pygame.image.load(filename)
+                    image = pygame.image.load(filename)
+                    if display_ready:
+                        image = image.convert_alpha() if key in transparent_images else image.convert()
+                    self.images[key] = image
                 else:
                     self.images[key] = None
             except pygame.error:
                 self.images[key] = None
 
+    def build_sky_cache(self, buckets=10):
+        """Pre-render 1px-wide sky gradient columns keyed by altitude bucket"""
+        sky_cache = {}
+        color_ratio = np.arange(self.HEIGHT, dtype=np.float32) / self.HEIGHT
+        
+        for bucket in range(buckets + 1):
+            altitude_intensity = bucket / buckets
+            base_r = int(135 - (altitude_intensity * 50))
+            base_g = int(206 - (altitude_intensity * 30))
+            base_b = int(235 - (altitude_intensity * 20))
+            
+            # Whole column in one vectorized pass, laid out as surfarray (w, h, rgb)
+            gradient = np.stack([
+                base_r + 25 * color_ratio,
+                base_g + 25 * color_ratio,
+                base_b + 20 * color_ratio
+            ], axis=-1)
+            gradient = np.clip(gradient, 0, 255).astype(np.uint8)[np.newaxis, :, :]
+            
+            column = pygame.Surface((1, self.HEIGHT))
+            pygame.surfarray.blit_array(column, gradient)
+            sky_cache[bucket] = column.convert()
+        
+        return sky_cache
+
+    def ground_color_for_altitude(self, altitude):
+        """Ground shade tier for the given altitude"""
+        if altitude < 50:
+            return (34, 139, 34)
+        elif altitude < 150:
+            return (20, 100, 20)
+        return (10, 60, 10)
+
     def create_research_scenario(self, scenario_type="basic"):
         """Create research scenario - no obstacles, optional targets"""
         if scenario_type in RESEARCH_SCENARIOS:
@@ -217,7 +319,8 @@ class FPVSimulator:
             f"EMG research scenario: {name}",
             obstacles,  # Always empty list
             targets,    # Optional based on config
-            180  # 3 minute research sessions
+            180,  # 3 minute research sessions
+            drone_size=self.drone.size  # Sizes the target grid's cells
         )
 
     def handle_configuration_input(self, key):
@@ -297,9 +400,10 @@ class FPVSimulator:
             
             # FIXED: Reduce keyboard throttle from 1.0 to 0.3 for gradual response
             throttle = 0.3 if (keys[pygame.K_SPACE] and not self.drone.crashed) else 0.0
-            yaw = (-0.5 if keys[pygame.K_q] else 0.0) + (0.5 if keys[pygame.K_e] else 0.0)
-            pitch = (0.5 if keys[pygame.K_w] else 0.0) + (-0.5 if keys[pygame.K_s] else 0.0)
-            roll = (-0.5 if keys[pygame.K_a] else 0.0) + (0.5 if keys[pygame.K_d] else 0.0)
+            # Key states are bools, so multiplying replaces the per-key branches
+            yaw = 0.5 * (keys[pygame.K_e] - keys[pygame.K_q])
+            pitch = 0.5 * (keys[pygame.K_w] - keys[pygame.K_s])
+            roll = 0.5 * (keys[pygame.K_d] - keys[pygame.K_a])
             
             # Don't simulate fake EMG signals when no Arduino
             return throttle, yaw, pitch, roll
@@ -323,12 +427,18 @@ class FPVSimulator:
         return self.collision.check_drone_ground_collision(self.drone)
 
     def check_fpv_target_collection(self):
-        """Use unified target collection"""
-        return self.collision.check_target_collection(
+        """Use unified target collection on the targets near the drone"""
+        target_grid = self.current_scenario.target_grid
+        collected_target = self.collision.check_target_collection(
             self.drone, 
-            self.current_scenario.targets, 
-            self.drone.rotation
+            self.current_scenario.target_batch, 
+            self.drone.rotation,
+            candidates=target_grid.lookup(self.drone.position)
         )
+        if collected_target:
+            target_grid.remove(collected_target)
+            self.current_scenario.targets_remaining -= 1
+        return collected_target
 
     def draw_fpv_ground(self):
         """Draw ground using unified horizon calculation"""
@@ -338,57 +448,48 @@ class FPVSimulator:
             actual_altitude
         )
         
-        # Sky (above horizon)
+        # Sky (above horizon) - stretch the cached gradient for this altitude
         if horizon_y > 0:
-            for y in range(min(horizon_y, self.HEIGHT)):
-                altitude_intensity = min(actual_altitude / 300.0, 1.0)
-                color_ratio = y / max(1, horizon_y)
-                
-                base_r = int(135 - (altitude_intensity * 50))
-                base_g = int(206 - (altitude_intensity * 30))
-                base_b = int(235 - (altitude_intensity * 20))
-                
-                r = max(0, min(255, int(base_r + (25 * color_ratio))))
-                g = max(0, min(255, int(base_g + (25 * color_ratio))))
-                b = max(0, min(255, int(base_b + (20 * color_ratio))))
-                
-                pygame.draw.line(self.screen, (r, g, b), (0, y), (self.WIDTH, y))
+            altitude_intensity = min(actual_altitude / 300.0, 1.0)
+            bucket = int(round(altitude_intensity * (len(self.sky_cache) - 1)))
+            sky_height = min(horizon_y, self.HEIGHT)
+            
+            # Rescale only when the bucket or horizon actually moves
+            if self.sky_scaled_key != (bucket, sky_height):
+                self.sky_scaled = pygame.transform.scale(self.sky_cache[bucket], (self.WIDTH, sky_height))
+                self.sky_scaled_key = (bucket, sky_height)
+            
+            self.screen.blit(self.sky_scaled, (0, 0))
         
         # Ground (below horizon)
         if horizon_y < self.HEIGHT:
-            ground_rect = pygame.Rect(0, max(0, horizon_y), self.WIDTH, self.HEIGHT - max(0, horizon_y))
+            self.ground_rect.y = max(0, horizon_y)
+            self.ground_rect.height = self.HEIGHT - self.ground_rect.y
             
-            if actual_altitude < 50:
-                ground_color = (34, 139, 34)
-            elif actual_altitude < 150:
-                ground_color = (20, 100, 20)
-            else:
-                ground_color = (10, 60, 10)
-                
-            pygame.draw.rect(self.screen, ground_color, ground_rect)
+            ground_color = self.ground_color_lut[min(len(self.ground_color_lut) - 1, int(actual_altitude))]
+            pygame.draw.rect(self.screen, ground_color, self.ground_rect)
 
     def draw_research_targets(self):
-        """Draw research targets using simplified renderer"""
-        for target in self.current_scenario.targets:
-            self.research_renderer.draw_target(
-                self.screen, 
-                target, 
-                self.project_3d_to_fpv,  # Use the original method
-                self.drone.position,
-                self.drone.rotation
-            )
-
-    def draw_hud(self):
+        """Draw research targets using one batched projection"""
+        screen_x, screen_y, depth, visible = self.physics.project_points_to_screen(
+            self.current_scenario.target_batch.positions,
+            self.drone.position,
+            self.drone.rotation
+        )
+        self.research_renderer.draw_targets_batch(
+            self.screen, 
+            self.current_scenario.target_batch, 
+            screen_x, screen_y, depth, visible
+        )
+
+    def draw_hud(self, current_time):
         """Draw HUD using integration function"""
-        targets_remaining = len([t for t in self.current_scenario.targets if not t.collected])
-        elapsed_time = time.time() - self.current_scenario.start_time
-        time_left = max(0, self.current_scenario.time_limit - elapsed_time)
-        
-        mission_data = {
-            'mission_name': self.current_scenario.name,
-            'targets_remaining': targets_remaining,
-            'time_left': time_left
-        }
+        elapsed_time = current_time - self.current_scenario.start_time
+        
+        mission_data = self.mission_data
+        mission_data['mission_name'] = self.current_scenario.name
+        mission_data['targets_remaining'] = self.current_scenario.targets_remaining
+        mission_data['time_left'] = max(0, self.current_scenario.time_limit - elapsed_time)
         
         integrate_hud_with_drone(self.drone, self.hud_system, self.screen, mission_data)
 
@@ -401,26 +502,28 @@ class FPVSimulator:
         line_height = 25
         
         if DebugConfig.SHOW_SPEED_DEBUG:
-            speed_text = self.font_small.render(f"Speed: {self.drone.get_speed_kmh():.1f} km/h", True, self.GREEN)
+            # Whole km/h keeps the rendered-text cache hit rate high
+            speed_text = self.render_text(f"Speed: {self.drone.get_speed_kmh():.0f} km/h", self.GREEN)
             self.screen.blit(speed_text, (10, debug_y))
             debug_y += line_height
 
-    def log_research_data(self, throttle, yaw, pitch, roll):
+    def log_research_data(self, throttle, yaw, pitch, roll, current_time):
         """Log research data every 10th frame"""
         self.debug_frame_counter += 1
         
         if self.debug_frame_counter % 10 == 0:
-            current_time = time.time()
             signal_quality = self.emg_evaluation.evaluate_signal_quality()
             fatigue_level = self.emg_evaluation.detect_fatigue()
             
-            debug_line = (f"{current_time:.2f},{throttle:.2f},{yaw:.2f},{pitch:.2f},{roll:.2f},"
-                         f"{self.drone.get_speed_kmh():.1f},"
-                         f"{self.physics.get_altitude_from_world_y(self.drone.position.y):.1f},"
-                         f"{signal_quality},{fatigue_level:.1f}\n")
+            self.debug_file.write(f"{current_time:.2f},{throttle:.2f},{yaw:.2f},{pitch:.2f},{roll:.2f},"
+                                  f"{self.drone.get_speed_kmh():.1f},"
+                                  f"{self.physics.get_altitude_from_world_y(self.drone.position.y):.1f},"
+                                  f"{signal_quality},{fatigue_level:.1f}\n")
             
-            self.debug_file.write(debug_line)
-            self.debug_file.flush()
+            # Let the 64KB buffer absorb writes; only force them out periodically
+            if current_time - self.last_debug_flush > self.debug_flush_interval:
+                self.debug_file.flush()
+                self.last_debug_flush = current_time
 
     def run(self):
         """Main research loop"""
@@ -433,8 +536,17 @@ class FPVSimulator:
         print("Research Focus: EMG signal validation")
         print("=" * 50)
         
+        previous_state = None
+        
         while running:
+            # Input or a state change can alter the whole screen; otherwise the
+            # menu screens only need their live regions pushed to the display
+            full_redraw = self.game_state != previous_state
+            dirty_rects = []
+            
             for event in pygame.event.get():
+                full_redraw = True
+                
                 if event.type == pygame.QUIT:
                     running = False
                     
@@ -463,35 +575,39 @@ class FPVSimulator:
             
             # Render based on current state
             if self.game_state == "CONFIGURATION":
-                self.config_ui.draw_screen(self.screen, self.config)
+                dirty_rects = self.config_ui.draw_screen(self.screen, self.config)
                 
             elif self.game_state == "EMG_CALIBRATION":
-                self.calibration_ui.draw_calibration_screen(self.screen, self.emg_evaluation)
+                dirty_rects = self.calibration_ui.draw_calibration_screen(self.screen, self.emg_evaluation, full_redraw)
                 
                 if ARDUINO_MODE:
                     self.emg_evaluation.update_emg_signals(emg_signals)
                 else:
                     # Simulate EMG for testing
                     keys = pygame.key.get_pressed()
-                    test_signals = [
-                        random.uniform(20, 80) if keys[pygame.K_SPACE] else random.uniform(10, 30),
-                        random.uniform(20, 80) if keys[pygame.K_q] or keys[pygame.K_e] else random.uniform(10, 30),
-                        random.uniform(20, 80) if keys[pygame.K_w] or keys[pygame.K_s] else random.uniform(10, 30),
-                        random.uniform(20, 80) if keys[pygame.K_a] or keys[pygame.K_d] else random.uniform(10, 30)
+                    active = [
+                        keys[pygame.K_SPACE],
+                        keys[pygame.K_q] or keys[pygame.K_e],
+                        keys[pygame.K_w] or keys[pygame.K_s],
+                        keys[pygame.K_a] or keys[pygame.K_d]
                     ]
-                    self.emg_evaluation.update_emg_signals(test_signals)
+                    row = self.noise_index & 4095
+                    self.noise_index += 1
+                    test_signals = np.where(active, self.noise_ring_high[row], self.noise_ring_low[row])
+                    self.emg_evaluation.update_emg_signals(test_signals.tolist())
                 
             elif self.game_state == "FLYING":
+                self.frame_time = time.time()
                 throttle, yaw, pitch, roll = self.process_emg_controls()
                 self.drone.update_physics(throttle, yaw, pitch, roll, emg_signals if ARDUINO_MODE else None)
+                self.physics.begin_frame(self.drone.rotation)
                 
-                self.log_research_data(throttle, yaw, pitch, roll)
+                self.log_research_data(throttle, yaw, pitch, roll, self.frame_time)
                 
-                if self.check_ground_collision():
-                     if not self.drone.crashed:  # Only crash once
-                        self.drone.crashed = True
-                        self.drone.velocity = Vector3(0, 0, 0)  # Stop all movement
-                        print(f"GROUND COLLISION at {self.drone.get_speed_kmh():.0f} km/h")
+                if self.check_ground_collision() and not self.drone.crashed:  # Only crash once
+                    self.drone.crashed = True
+                    self.drone.velocity = Vector3(0, 0, 0)  # Stop all movement
+                    print(f"GROUND COLLISION at {self.drone.get_speed_kmh():.0f} km/h")
                 
                 if not DebugConfig.DISABLE_TARGETS:
                     collected_target = self.check_fpv_target_collection()
@@ -512,20 +628,26 @@ class FPVSimulator:
                 if not DebugConfig.DISABLE_TARGETS:
                     self.draw_research_targets()
                 
-                self.draw_hud()
+                self.draw_hud(self.frame_time)
                 
                 if EMGConfig.SHOW_EMG_SIGNALS and ARDUINO_MODE:
                     self.emg_evaluation.draw_evaluation_hud(self.screen, 10, 10)
                 
                 self.draw_debug_info()
             
-            pygame.display.flip()
+            # FLYING redraws sky and ground every frame, so always flip there
+            if self.game_state == "FLYING" or full_redraw:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty_rects)
+            previous_state = self.game_state
             clock.tick(60)
         
         self.cleanup_research_session()
 
     def save_evaluation_report(self, report):
         """Save research evaluation report"""
+        report = report.snapshot()
         
         # Ensure reports directory exists
         os.makedirs("data_output/reports", exist_ok=True)
@@ -558,6 +680,7 @@ class FPVSimulator:
         global breaking_case
         breaking_case = True
         
+        self.emg_evaluation.stop_analytics_worker()
         self.emg_evaluation.close_logging()
         final_report = self.emg_evaluation.generate_evaluation_report()
         self.save_evaluation_report(final_report)
@@ -577,9 +700,7 @@ class FPVSimulator:
 
 if __name__ == "__main__":
     # Force research mode configuration
-    DebugConfig.RESEARCH_MODE = True
-    DebugConfig.EMPTY_ENVIRONMENT = True
-    DebugConfig.DISABLE_OBSTACLES = True
+    DebugConfig.force_research_mode()
     
     # Initialize and run research simulator
     simulator = FPVSimulator()
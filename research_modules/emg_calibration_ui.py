@@ -1,68 +1,192 @@
 import pygame
 import time
+import functools
+from font_cache import get_font
+
+# Colors
+WHITE = (255, 255, 255)
+GREEN = (0, 255, 0)
+BLUE = (0, 150, 255)
+RED = (255, 0, 0)
+YELLOW = (255, 255, 0)
+GRAY = (128, 128, 128)
+
+# Calibration steps in order, and each step's position for the progress bar
+CALIBRATION_STATES = ("baseline", "throttle", "yaw", "pitch", "roll", "complete")
+CALIBRATION_STATE_INDEX = {state: i for i, state in enumerate(CALIBRATION_STATES)}
+MUSCLE_STATES = frozenset(("throttle", "yaw", "pitch", "roll"))
+
+# EMG channels as (channel, readout label, x offset, y offset) - readouts sit in a 2x2 grid
+EMG_CHANNELS = (
+    ("throttle", "Throttle (A0)", -100, 30),
+    ("yaw", "Yaw (A1)", 100, 30),
+    ("pitch", "Pitch (A2)", -100, 60),
+    ("roll", "Roll (A3)", 100, 60),
+)
+
+# Fixed y positions of the instruction lines below the 180px heading
+BASELINE_DETAIL_YS = tuple(180 + 50 + i * 30 for i in range(5))
+CALIB_INSTRUCTION_YS = tuple(180 + 210 + i * 25 for i in range(4))
 
 class EMGCalibrationUI:
     """UI for EMG calibration process with BioAmp EXG Pill"""
     
+    __slots__ = ('screen_width', 'screen_height', 'font_large', 'font_medium', 'font_small',
+                 'render_text', 'render_channel_value', 'calibration_state', 'countdown_timer',
+                 'instruction_start_time', 'live_values_rect', 'progress_bar_rect', 'progress_fill_rect',
+                 'static_background', 'static_background_state', 'channel_readouts')
+    
+    # Muscle mapping for instructions, shared by every frame and instance
+    MUSCLE_INFO = {
+        "throttle": {
+            "muscle": "Forearm Flexor Muscles",
+            "action": "Wrist Flexion",
+            "description": "Bend your wrist downward (palm toward forearm)",
+            "electrode_pos": "Ventral forearm, 1/3 from wrist",
+            "function": "Controls drone throttle (vertical movement)"
+        },
+        "yaw": {
+            "muscle": "Forearm Extensor Muscles", 
+            "action": "Wrist Extension",
+            "description": "Bend your wrist upward (back of hand toward forearm)",
+            "electrode_pos": "Dorsal forearm, 1/3 from wrist",
+            "function": "Controls drone yaw (rotation left/right)"
+        },
+        "pitch": {
+            "muscle": "Bicep Brachii",
+            "action": "Elbow Flexion", 
+            "description": "Bend your elbow (bring hand toward shoulder)",
+            "electrode_pos": "Anterior upper arm, muscle belly",
+            "function": "Controls drone pitch (nose up/down)"
+        },
+        "roll": {
+            "muscle": "Tricep Brachii",
+            "action": "Elbow Extension",
+            "description": "Straighten your elbow (extend arm)",
+            "electrode_pos": "Posterior upper arm, lateral head",
+            "function": "Controls drone roll (banking left/right)"
+        }
+    }
+    
     def __init__(self, screen_width, screen_height):
         self.screen_width = screen_width
         self.screen_height = screen_height
         
-        # Fonts
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 32)
-        self.font_small = pygame.font.Font(None, 24)
+        # Fonts - created on first draw so constructing the UI doesn't need SDL_ttf
+        self.font_large = None
+        self.font_medium = None
+        self.font_small = None
         
-        # Colors
-        self.WHITE = (255, 255, 255)
-        self.GREEN = (0, 255, 0)
-        self.BLUE = (0, 150, 255)
-        self.RED = (255, 0, 0)
-        self.YELLOW = (255, 255, 0)
-        self.GRAY = (128, 128, 128)
+        # Rendered text surfaces keyed by (font, text, color) - nearly every string is static
+        self.render_text = functools.lru_cache(maxsize=256)(self._render_text)
+        # Live channel readouts get their own cache so they never evict the static strings
+        self.render_channel_value = functools.lru_cache(maxsize=200)(self._render_channel_value)
         
         # Calibration state management
         self.calibration_state = "baseline"  # "baseline", "throttle", "yaw", "pitch", "roll", "complete"
         self.countdown_timer = 0
         self.instruction_start_time = time.time()
         
-    def draw_calibration_screen(self, screen, emg_eval):
-        """Draw EMG calibration instruction screen"""
-        screen.fill((20, 30, 60))  # Dark blue background
+        # Region redrawn every frame by _draw_current_emg_values
+        self.live_values_rect = pygame.Rect(0, 430, screen_width, 100)
+        
+        # Live readouts as (channel, label, centre) under the values title
+        self.channel_readouts = tuple(
+            (channel, label, (screen_width//2 + x_offset, 450 + y_offset))
+            for channel, label, x_offset, y_offset in EMG_CHANNELS
+        )
+        
+        # Static parts of the screen, re-rendered when calibration_state changes
+        self.static_background = None
+        self.static_background_state = None
+        
+        # Progress bar is centred on a fixed-width screen; only the fill's width ever changes
+        self.progress_bar_rect = pygame.Rect((screen_width - 400) // 2, 600, 400, 20)
+        self.progress_fill_rect = self.progress_bar_rect.copy()
+        
+    def _ensure_fonts(self):
+        """Load the UI fonts the first time the screen is drawn"""
+        if self.font_large is None:
+            self.font_large = get_font(48)
+            self.font_medium = get_font(32)
+            self.font_small = get_font(24)
+    
+    def _render_text(self, font, text, color):
+        """Render antialiased UI text (wrapped by the render_text LRU cache)"""
+        return font.render(text, True, color).convert_alpha()
+    
+    def _render_channel_value(self, label, value, color, center):
+        """Render one channel readout and its top-left for the given centre
+        
+        value is pre-rounded to the displayed precision.
+        """
+        surface = self._render_text(self.font_small, f"{label}: {value:.1f}", color)
+        return surface, surface.get_rect(center=center).topleft
+    
+    def draw_calibration_screen(self, screen, emg_eval, full_redraw=True):
+        """Draw EMG calibration instruction screen, returning the regions that change per frame
+        
+        With full_redraw=False the screen is assumed to still hold last frame's
+        calibration screen, so only the live values region is restored and redrawn.
+        """
+        self._ensure_fonts()
+        
+        # Everything except the live EMG readouts only changes with the calibration step
+        if self.static_background_state != self.calibration_state:
+            self.static_background = self._build_static_background(emg_eval)
+            self.static_background_state = self.calibration_state
+            full_redraw = True
+        
+        if full_redraw:
+            screen.blit(self.static_background, (0, 0))
+        else:
+            screen.blit(self.static_background, self.live_values_rect, self.live_values_rect)
+        
+        # Current EMG values display
+        self._draw_current_emg_values(screen, emg_eval)
+        
+        return [screen.get_rect()] if full_redraw else [self.live_values_rect]
+    
+    def _build_static_background(self, emg_eval):
+        """Pre-render the fill, instructions, progress bar and controls for the current step"""
+        background = pygame.Surface((self.screen_width, self.screen_height)).convert()
+        background.fill((20, 30, 60))  # Dark blue background
         
         # Title
-        title = self.font_large.render("EMG Calibration - BioAmp EXG Pill", True, self.WHITE)
+        title = self.render_text(self.font_large, "EMG Calibration - BioAmp EXG Pill", WHITE)
         title_rect = title.get_rect(center=(self.screen_width//2, 80))
-        screen.blit(title, title_rect)
+        background.blit(title, title_rect)
         
         # Subtitle
-        subtitle = self.font_medium.render("Arduino Uno R4 + 4-Channel EMG Acquisition", True, self.YELLOW)
+        subtitle = self.render_text(self.font_medium, "Arduino Uno R4 + 4-Channel EMG Acquisition", YELLOW)
         subtitle_rect = subtitle.get_rect(center=(self.screen_width//2, 110))
-        screen.blit(subtitle, subtitle_rect)
+        background.blit(subtitle, subtitle_rect)
         
         # Instructions based on current calibration state
         if self.calibration_state == "baseline":
-            self._draw_baseline_instructions(screen, emg_eval)
-        elif self.calibration_state in ["throttle", "yaw", "pitch", "roll"]:
-            self._draw_muscle_calibration_instructions(screen, emg_eval)
+            self._draw_baseline_instructions(background, emg_eval)
+        elif self.calibration_state in MUSCLE_STATES:
+            self._draw_muscle_calibration_instructions(background, emg_eval)
         else:  # complete
-            self._draw_completion_screen(screen, emg_eval)
+            self._draw_completion_screen(background, emg_eval)
         
-        # Current EMG values display
-        self._draw_current_emg_values(screen, emg_eval)
+        # Heading for the live values drawn each frame
+        self._draw_values_title(background)
         
         # Progress indicator
-        self._draw_progress_indicator(screen)
+        self._draw_progress_indicator(background)
         
         # Control instructions
-        self._draw_control_instructions(screen)
+        self._draw_control_instructions(background)
+        
+        return background
     
     def _draw_baseline_instructions(self, screen, emg_eval):
         """Draw baseline calibration instructions"""
         instruction_y = 180
         
         # Main instruction
-        instruction = self.font_large.render("BASELINE CALIBRATION", True, self.BLUE)
+        instruction = self.render_text(self.font_large, "BASELINE CALIBRATION", BLUE)
         instruction_rect = instruction.get_rect(center=(self.screen_width//2, instruction_y))
         screen.blit(instruction, instruction_rect)
         
@@ -75,18 +199,18 @@ class EMGCalibrationUI:
             "This establishes your resting EMG baseline"
         ]
         
-        for i, detail in enumerate(details):
-            detail_text = self.font_medium.render(detail, True, self.WHITE)
-            detail_rect = detail_text.get_rect(center=(self.screen_width//2, instruction_y + 50 + i * 30))
+        for detail, y in zip(details, BASELINE_DETAIL_YS):
+            detail_text = self.render_text(self.font_medium, detail, WHITE)
+            detail_rect = detail_text.get_rect(center=(self.screen_width//2, y))
             screen.blit(detail_text, detail_rect)
         
         # Duration indicator
-        duration_text = self.font_medium.render("Duration: 10 seconds of complete rest", True, self.GRAY)
+        duration_text = self.render_text(self.font_medium, "Duration: 10 seconds of complete rest", GRAY)
         duration_rect = duration_text.get_rect(center=(self.screen_width//2, instruction_y + 220))
         screen.blit(duration_text, duration_rect)
         
         # Start instruction
-        start_text = self.font_medium.render("Press 'C' to start baseline calibration", True, self.GREEN)
+        start_text = self.render_text(self.font_medium, "Press 'C' to start baseline calibration", GREEN)
         start_rect = start_text.get_rect(center=(self.screen_width//2, instruction_y + 260))
         screen.blit(start_text, start_rect)
     
@@ -94,66 +218,34 @@ class EMGCalibrationUI:
         """Draw muscle-specific calibration instructions"""
         instruction_y = 180
         
-        # Muscle mapping for instructions
-        muscle_info = {
-            "throttle": {
-                "muscle": "Forearm Flexor Muscles",
-                "action": "Wrist Flexion",
-                "description": "Bend your wrist downward (palm toward forearm)",
-                "electrode_pos": "Ventral forearm, 1/3 from wrist",
-                "function": "Controls drone throttle (vertical movement)"
-            },
-            "yaw": {
-                "muscle": "Forearm Extensor Muscles", 
-                "action": "Wrist Extension",
-                "description": "Bend your wrist upward (back of hand toward forearm)",
-                "electrode_pos": "Dorsal forearm, 1/3 from wrist",
-                "function": "Controls drone yaw (rotation left/right)"
-            },
-            "pitch": {
-                "muscle": "Bicep Brachii",
-                "action": "Elbow Flexion", 
-                "description": "Bend your elbow (bring hand toward shoulder)",
-                "electrode_pos": "Anterior upper arm, muscle belly",
-                "function": "Controls drone pitch (nose up/down)"
-            },
-            "roll": {
-                "muscle": "Tricep Brachii",
-                "action": "Elbow Extension",
-                "description": "Straighten your elbow (extend arm)",
-                "electrode_pos": "Posterior upper arm, lateral head",
-                "function": "Controls drone roll (banking left/right)"
-            }
-        }
-        
-        current_muscle = muscle_info[self.calibration_state]
+        current_muscle = EMGCalibrationUI.MUSCLE_INFO[self.calibration_state]
         
         # Main instruction
-        instruction = self.font_large.render(f"{self.calibration_state.upper()} CALIBRATION", True, self.GREEN)
+        instruction = self.render_text(self.font_large, f"{self.calibration_state.upper()} CALIBRATION", GREEN)
         instruction_rect = instruction.get_rect(center=(self.screen_width//2, instruction_y))
         screen.blit(instruction, instruction_rect)
         
         # Muscle information
-        muscle_text = self.font_medium.render(f"Muscle: {current_muscle['muscle']}", True, self.WHITE)
+        muscle_text = self.render_text(self.font_medium, f"Muscle: {current_muscle['muscle']}", WHITE)
         muscle_rect = muscle_text.get_rect(center=(self.screen_width//2, instruction_y + 50))
         screen.blit(muscle_text, muscle_rect)
         
-        action_text = self.font_medium.render(f"Action: {current_muscle['action']}", True, self.BLUE)
+        action_text = self.render_text(self.font_medium, f"Action: {current_muscle['action']}", BLUE)
         action_rect = action_text.get_rect(center=(self.screen_width//2, instruction_y + 80))
         screen.blit(action_text, action_rect)
         
         # Description
-        desc_text = self.font_small.render(current_muscle['description'], True, self.YELLOW)
+        desc_text = self.render_text(self.font_small, current_muscle['description'], YELLOW)
         desc_rect = desc_text.get_rect(center=(self.screen_width//2, instruction_y + 110))
         screen.blit(desc_text, desc_rect)
         
         # Electrode position
-        electrode_text = self.font_small.render(f"Electrode Position: {current_muscle['electrode_pos']}", True, self.GRAY)
+        electrode_text = self.render_text(self.font_small, f"Electrode Position: {current_muscle['electrode_pos']}", GRAY)
         electrode_rect = electrode_text.get_rect(center=(self.screen_width//2, instruction_y + 140))
         screen.blit(electrode_text, electrode_rect)
         
         # Function explanation
-        function_text = self.font_small.render(f"Function: {current_muscle['function']}", True, self.GRAY)
+        function_text = self.render_text(self.font_small, f"Function: {current_muscle['function']}", GRAY)
         function_rect = function_text.get_rect(center=(self.screen_width//2, instruction_y + 170))
         screen.blit(function_text, function_rect)
         
@@ -165,9 +257,9 @@ class EMGCalibrationUI:
             "4. Press 'C' when ready to calibrate"
         ]
         
-        for i, instruction in enumerate(calib_instructions):
-            inst_text = self.font_small.render(instruction, True, self.WHITE)
-            inst_rect = inst_text.get_rect(center=(self.screen_width//2, instruction_y + 210 + i * 25))
+        for instruction, y in zip(calib_instructions, CALIB_INSTRUCTION_YS):
+            inst_text = self.render_text(self.font_small, instruction, WHITE)
+            inst_rect = inst_text.get_rect(center=(self.screen_width//2, y))
             screen.blit(inst_text, inst_rect)
     
     def _draw_completion_screen(self, screen, emg_eval):
@@ -175,93 +267,84 @@ class EMGCalibrationUI:
         instruction_y = 200
         
         # Completion message
-        complete_text = self.font_large.render("CALIBRATION COMPLETE", True, self.GREEN)
+        complete_text = self.render_text(self.font_large, "CALIBRATION COMPLETE", GREEN)
         complete_rect = complete_text.get_rect(center=(self.screen_width//2, instruction_y))
         screen.blit(complete_text, complete_rect)
         
         # Status message
-        status_text = self.font_medium.render("EMG system ready for flight control", True, self.WHITE)
+        status_text = self.render_text(self.font_medium, "EMG system ready for flight control", WHITE)
         status_rect = status_text.get_rect(center=(self.screen_width//2, instruction_y + 50))
         screen.blit(status_text, status_rect)
         
         # Calibration summary
         summary_y = instruction_y + 100
-        summary_title = self.font_medium.render("Calibration Summary:", True, self.YELLOW)
+        summary_title = self.render_text(self.font_medium, "Calibration Summary:", YELLOW)
         summary_rect = summary_title.get_rect(center=(self.screen_width//2, summary_y))
         screen.blit(summary_title, summary_rect)
         
         # Show baseline values
-        if hasattr(emg_eval, 'baseline'):
-            channels = ['throttle', 'yaw', 'pitch', 'roll']
-            for i, channel in enumerate(channels):
-                baseline_val = emg_eval.baseline.get(channel, 0)
-                max_val = emg_eval.max_values.get(channel, 100)
+        baseline = getattr(emg_eval, 'baseline', None)
+        if baseline is not None:
+            max_values = emg_eval.max_values
+            for i, (channel, _, _, _) in enumerate(EMG_CHANNELS):
+                baseline_val = baseline.get(channel, 0)
+                max_val = max_values.get(channel, 100)
                 summary_line = f"{channel.title()}: Baseline {baseline_val:.1f}, Max {max_val:.1f}"
-                summary_text = self.font_small.render(summary_line, True, self.WHITE)
+                summary_text = self.render_text(self.font_small, summary_line, WHITE)
                 summary_text_rect = summary_text.get_rect(center=(self.screen_width//2, summary_y + 40 + i * 25))
                 screen.blit(summary_text, summary_text_rect)
         
         # Start flight instruction
-        start_text = self.font_medium.render("Press SPACE to start flight simulation", True, self.GREEN)
+        start_text = self.render_text(self.font_medium, "Press SPACE to start flight simulation", GREEN)
         start_rect = start_text.get_rect(center=(self.screen_width//2, instruction_y + 250))
         screen.blit(start_text, start_rect)
     
+    def _draw_values_title(self, screen):
+        """Draw the heading above the real-time EMG values"""
+        values_title = self.render_text(self.font_medium, "Real-time EMG Values", WHITE)
+        values_rect = values_title.get_rect(center=(self.screen_width//2, 450))
+        screen.blit(values_title, values_rect)
+    
     def _draw_current_emg_values(self, screen, emg_eval):
         """Draw real-time EMG values during calibration"""
-        values_y = 450
-        
-        # Title
-        values_title = self.font_medium.render("Real-time EMG Values", True, self.WHITE)
-        values_rect = values_title.get_rect(center=(self.screen_width//2, values_y))
-        screen.blit(values_title, values_rect)
-        
-        # Channel values
-        channels = ['throttle', 'yaw', 'pitch', 'roll']
-        channel_labels = ['Throttle (A0)', 'Yaw (A1)', 'Pitch (A2)', 'Roll (A3)']
-        
-        for i, (channel, label) in enumerate(zip(channels, channel_labels)):
-            if hasattr(emg_eval, 'signal_history') and emg_eval.signal_history[channel]:
-                current_value = emg_eval.signal_history[channel][-1]
-                
+        # Channel values - resolve the lookup once rather than per channel
+        latest_signal = getattr(emg_eval, 'latest_signal', None)
+        if latest_signal is None:
+            return
+        
+        for channel, label, center in self.channel_readouts:
+            current_value = latest_signal(channel)
+            if current_value is not None:
                 # Determine color based on signal strength
                 if current_value > 50:
-                    color = self.GREEN
+                    color = GREEN
                 elif current_value > 25:
-                    color = self.YELLOW
+                    color = YELLOW
                 else:
-                    color = self.WHITE
-                
-                value_text = self.font_small.render(f"{label}: {current_value:.1f}", True, color)
+                    color = WHITE
                 
-                # Position in 2x2 grid
-                x_offset = -100 if i % 2 == 0 else 100
-                y_offset = 30 if i < 2 else 60
-                
-                value_rect = value_text.get_rect(center=(self.screen_width//2 + x_offset, values_y + y_offset))
-                screen.blit(value_text, value_rect)
+                # Rounding first means an unchanged readout is a cache hit with no formatting
+                screen.blit(*self.render_channel_value(label, round(current_value, 1), color, center))
     
     def _draw_progress_indicator(self, screen):
         """Draw calibration progress indicator"""
-        progress_y = 600
+        bar = self.progress_bar_rect
+        progress_y = bar.y
         
         # Progress bar background
-        bar_width = 400
-        bar_height = 20
-        bar_x = (self.screen_width - bar_width) // 2
-        
-        pygame.draw.rect(screen, self.GRAY, (bar_x, progress_y, bar_width, bar_height))
+        pygame.draw.rect(screen, GRAY, bar)
         
         # Progress fill
-        states = ["baseline", "throttle", "yaw", "pitch", "roll", "complete"]
-        current_progress = states.index(self.calibration_state) if self.calibration_state in states else 0
-        progress_width = int((current_progress / (len(states) - 1)) * bar_width)
+        current_progress = CALIBRATION_STATE_INDEX.get(self.calibration_state, 0)
+        progress_width = int((current_progress / (len(CALIBRATION_STATES) - 1)) * bar.width)
         
         if progress_width > 0:
-            pygame.draw.rect(screen, self.GREEN, (bar_x, progress_y, progress_width, bar_height))
+            self.progress_fill_rect.width = progress_width
+            pygame.draw.rect(screen, GREEN, self.progress_fill_rect)
         
         # Progress text
-        progress_text = f"Step {current_progress + 1} of {len(states)}: {self.calibration_state.title()}"
-        progress_display = self.font_small.render(progress_text, True, self.WHITE)
+        progress_text = f"Step {current_progress + 1} of {len(CALIBRATION_STATES)}: {self.calibration_state.title()}"
+        progress_display = self.render_text(self.font_small, progress_text, WHITE)
         progress_rect = progress_display.get_rect(center=(self.screen_width//2, progress_y - 15))
         screen.blit(progress_display, progress_rect)
     
@@ -274,12 +357,12 @@ class EMGCalibrationUI:
         else:
             control_text = "C = Continue Calibration | ESC = Return to Config"
         
-        controls_display = self.font_small.render(control_text, True, self.GRAY)
+        controls_display = self.render_text(self.font_small, control_text, GRAY)
         controls_rect = controls_display.get_rect(center=(self.screen_width//2, controls_y))
         screen.blit(controls_display, controls_rect)
         
         # Hardware reminder
         hardware_text = "Ensure BioAmp EXG Pill is connected and electrodes are properly placed"
-        hardware_display = self.font_small.render(hardware_text, True, self.GRAY)
+        hardware_display = self.render_text(self.font_small, hardware_text, GRAY)
         hardware_rect = hardware_display.get_rect(center=(self.screen_width//2, controls_y + 20))
         screen.blit(hardware_display, hardware_rect)
\ No newline at end of file
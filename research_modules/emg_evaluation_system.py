@@ -2,9 +2,55 @@ import pygame
 import numpy as np
 import time
 import csv
-from collections import deque
-import math
+import functools
+import json
 import os
+import threading
+from dataclasses import dataclass
+from config import DataConfig
+from font_cache import get_font
+
+# Columns of every EMG log row, in order
+LOG_COLUMNS = (
+    'timestamp', 'throttle_raw', 'yaw_raw', 'pitch_raw', 'roll_raw',
+    'throttle_processed', 'yaw_processed', 'pitch_processed', 'roll_processed',
+    'snr_throttle', 'snr_yaw', 'snr_pitch', 'snr_roll',
+    'control_accuracy', 'response_latency', 'fatigue_indicator'
+)
+
+# Binary log record: seconds since session start stay float64 so sample timing
+# keeps sub-millisecond resolution; everything else fits float32
+LOG_RECORD_DTYPE = np.dtype([('timestamp', '<f8')] + [(name, '<f4') for name in LOG_COLUMNS[1:]])
+
+@dataclass(frozen=True)
+class EMGReport:
+    """Evaluation report - every field is a copy taken when the report was generated"""
+    __slots__ = ('session_duration', 'signal_quality', 'snr_values', 'crosstalk_matrix',
+                 'control_accuracy', 'fatigue_level', 'calibration_complete',
+                 'baseline_values', 'max_values')
+    session_duration: float
+    signal_quality: str
+    snr_values: dict
+    crosstalk_matrix: np.ndarray
+    control_accuracy: float
+    fatigue_level: float
+    calibration_complete: bool
+    baseline_values: dict
+    max_values: dict
+    
+    def snapshot(self):
+        """The report as a plain dict, with its own copies so the report itself stays unchanged"""
+        return {
+            'session_duration': self.session_duration,
+            'signal_quality': self.signal_quality,
+            'snr_values': self.snr_values.copy(),
+            'crosstalk_matrix': self.crosstalk_matrix.copy(),
+            'control_accuracy': self.control_accuracy,
+            'fatigue_level': self.fatigue_level,
+            'calibration_complete': self.calibration_complete,
+            'baseline_values': self.baseline_values.copy(),
+            'max_values': self.max_values.copy()
+        }
 
 class EMGEvaluationSystem:
     """
@@ -12,27 +58,42 @@ class EMGEvaluationSystem:
     Monitors signal quality, calibration, and control performance.
     """
     
+    CHANNELS = ('throttle', 'yaw', 'pitch', 'roll')
+    HISTORY_LENGTH = 1000
+    ANALYTICS_INTERVAL = 50  # Samples between SNR/crosstalk refreshes
+    SNR_WINDOW = 500         # Latest samples used for the SNR estimate
+    LOG_BATCH_ROWS = 256     # CSV rows buffered before each write
+    HUD_PANEL_SIZE = (280, 350)  # Reduced width/height
+    
     def __init__(self):
-        # Signal storage for analysis
-        self.signal_history = {
-            'throttle': deque(maxlen=1000),
-            'yaw': deque(maxlen=1000),
-            'pitch': deque(maxlen=1000),
-            'roll': deque(maxlen=1000)
-        }
+        # Signal storage for analysis - one ring buffer row per channel
+        self._buf = np.zeros((len(self.CHANNELS), self.HISTORY_LENGTH), np.float32)
+        self._idx = 0    # Column the next sample is written to
+        self._count = 0  # Samples held, up to HISTORY_LENGTH
+        self._analytics_counter = 0
+        # SNR/crosstalk only refresh per sample while something reads them every frame
+        self.analytics_enabled = True
+        # Refreshes run on a worker thread so they never stall a frame; started on first use
+        self._analytics_wakeup = threading.Event()
+        self._analytics_worker = None
+        self._analytics_stopping = False
         
         # Baseline values (set during calibration)
         self.baseline = {'throttle': 0, 'yaw': 0, 'pitch': 0, 'roll': 0}
         self.max_values = {'throttle': 100, 'yaw': 100, 'pitch': 100, 'roll': 100}
+        self._refresh_calibration_arrays()
         
         # Signal quality metrics
         self.snr_values = {'throttle': 0, 'yaw': 0, 'pitch': 0, 'roll': 0}
+        self._snr_db = np.zeros(len(self.CHANNELS))  # Same values in channel order
         self.crosstalk_matrix = np.zeros((4, 4))  # Inter-channel interference
         
         # Performance tracking
         self.calibration_complete = False
         self.session_start_time = time.time()
         self.emg_log_file = None
+        self._csv_writer = None
+        self._row_buf = []
         
         # Evaluation criteria
         self.evaluation_results = {
@@ -51,9 +112,71 @@ class EMGEvaluationSystem:
         self.BLUE = (0, 150, 255)
         
         # Fonts
-        self.font_large = pygame.font.Font(None, 32)
-        self.font_medium = pygame.font.Font(None, 24)
-        self.font_small = pygame.font.Font(None, 18)
+        self.font_large = get_font(32)
+        self.font_medium = get_font(24)
+        self.font_small = get_font(18)
+        
+        # HUD text surfaces keyed by (font, text, color) - labels are static and values repeat
+        self.render_text = functools.lru_cache(maxsize=256)(self._render_text)
+        
+        # Translucent HUD backing panel - identical every frame, so built once
+        self._hud_panel = pygame.Surface(self.HUD_PANEL_SIZE, pygame.SRCALPHA)
+        self._hud_panel.fill((0, 0, 0, 180))
+        # Panel text on a transparent layer, re-rendered only when a shown metric changes
+        self._hud_text = pygame.Surface(self.HUD_PANEL_SIZE, pygame.SRCALPHA)
+        self._hud_dirty = True
+    
+    def _render_text(self, font, text, color):
+        """Render antialiased HUD text (wrapped by the render_text LRU cache)"""
+        return font.render(text, True, color).convert_alpha()
+    
+    def _refresh_calibration_arrays(self):
+        """Mirror baseline/max_values as channel-ordered arrays for the per-sample maths"""
+        self._baseline_arr = np.array([self.baseline[ch] for ch in self.CHANNELS], np.float32)
+        signal_range = np.array([self.max_values[ch] for ch in self.CHANNELS], np.float32) - self._baseline_arr
+        # A channel with no usable range always normalizes to 0
+        self._inv_range_arr = np.divide(1.0, signal_range, out=np.zeros_like(signal_range), where=signal_range > 0)
+    
+    def _recent(self, ch_i, n):
+        """Last n samples (oldest first) for channel index ch_i, or a slice of channels"""
+        # Snapshot the write position - the analytics worker reads while samples arrive
+        end = self._idx
+        n = min(n, self._count)
+        start = end - n
+        if start >= 0:
+            return self._buf[ch_i, start:end]
+        # Window wraps past the end of the ring
+        return np.concatenate((self._buf[ch_i, start:], self._buf[ch_i, :end]), axis=-1)
+    
+    def latest_signal(self, channel):
+        """Most recent sample for a channel, or None before any data arrives"""
+        if not self._count:
+            return None
+        return float(self._buf[self.CHANNELS.index(channel), self._idx - 1])
+    
+    def set_analytics_enabled(self, enabled):
+        """Turn the per-sample SNR/crosstalk refresh on or off"""
+        self.analytics_enabled = enabled
+        self._analytics_counter = 0
+    
+    def _analytics_loop(self):
+        """Worker thread body - refresh SNR/crosstalk each time update_emg_signals asks"""
+        while True:
+            self._analytics_wakeup.wait()
+            self._analytics_wakeup.clear()
+            if self._analytics_stopping:
+                return
+            self.calculate_snr()
+            self.calculate_crosstalk()
+    
+    def stop_analytics_worker(self):
+        """Stop the analytics worker thread, if it was started"""
+        if self._analytics_worker is not None:
+            self._analytics_stopping = True
+            self._analytics_wakeup.set()
+            self._analytics_worker.join()
+            self._analytics_worker = None
+            self._analytics_stopping = False
     
     def initialize_logging(self, session_id=None):
         """Initialize EMG data logging for research analysis"""
@@ -63,18 +186,29 @@ class EMGEvaluationSystem:
         # Ensure directory exists
         os.makedirs("data_output/emg_data", exist_ok=True)
 
-        filename = f"data_output/emg_data/emg_evaluation_{session_id}.csv"  # Fixed path
-        self.emg_log_file = open(filename, 'w', newline='')
-        writer = csv.writer(self.emg_log_file)
-        
-        # Write header
-        writer.writerow([
-            'timestamp', 'throttle_raw', 'yaw_raw', 'pitch_raw', 'roll_raw',
-            'throttle_processed', 'yaw_processed', 'pitch_processed', 'roll_processed',
-            'snr_throttle', 'snr_yaw', 'snr_pitch', 'snr_roll',
-            'control_accuracy', 'response_latency', 'fatigue_indicator'
-        ])
+        base_name = f"data_output/emg_data/emg_evaluation_{session_id}"  # Fixed path
+        self._row_buf = []
         
+        if DataConfig.EMG_LOG_FORMAT == "csv":
+            filename = f"{base_name}.csv"
+            self.emg_log_file = open(filename, 'w', newline='')
+            self._csv_writer = csv.writer(self.emg_log_file)
+            
+            # Write header
+            self._csv_writer.writerow(LOG_COLUMNS)
+        else:
+            # Packed LOG_RECORD_DTYPE records - load with np.fromfile(filename, LOG_RECORD_DTYPE)
+            filename = f"{base_name}.f32"
+            self.emg_log_file = open(filename, 'wb')
+            self._csv_writer = None
+            
+            # Record layout lives in a sidecar since the records carry no header
+            with open(f"{base_name}.meta.json", 'w') as meta_file:
+                json.dump({'dtype': LOG_RECORD_DTYPE.descr, 'columns': list(LOG_COLUMNS),
+                           'timestamp': 'seconds since session start'}, meta_file, indent=2)
+        
+        # Every logged row carries the current SNR
+        self.set_analytics_enabled(True)
         print(f"EMG evaluation logging started: {filename}")
     
     def update_emg_signals(self, raw_signals, arduino_connected=False):
@@ -96,18 +230,26 @@ class EMGEvaluationSystem:
                 'fatigue_level': 0.0,
                 'overall_score': 0.0
             }
+            self._hud_dirty = True
             return
         
         # Existing EMG processing code only runs with real hardware
-        channels = ['throttle', 'yaw', 'pitch', 'roll']
-        
-        for i, channel in enumerate(channels):
-            if i < len(raw_signals):
-                self.signal_history[channel].append(raw_signals[i])
-        
-        # Calculate real-time metrics only for real EMG data
-        self.calculate_snr()
-        self.calculate_crosstalk()
+        n = min(len(raw_signals), len(self.CHANNELS))
+        self._buf[:n, self._idx] = raw_signals[:n]
+        self._idx = (self._idx + 1) % self.HISTORY_LENGTH
+        self._count = min(self._count + 1, self.HISTORY_LENGTH)
+        
+        # Calculate real-time metrics only for real EMG data - a slice of the
+        # 1000-sample window barely moves them, so refresh every few samples
+        if self.analytics_enabled:
+            self._analytics_counter += 1
+            if self._analytics_counter >= self.ANALYTICS_INTERVAL:
+                self._analytics_counter = 0
+                if self._analytics_worker is None:
+                    self._analytics_worker = threading.Thread(target=self._analytics_loop, daemon=True)
+                    self._analytics_worker.start()
+                # A refresh still in progress simply absorbs this request
+                self._analytics_wakeup.set()
         
         # Log data if logging is enabled
         if self.emg_log_file:
@@ -115,62 +257,71 @@ class EMGEvaluationSystem:
     
     def calculate_snr(self):
         """Calculate Signal-to-Noise Ratio for each channel"""
-        for channel in ['throttle', 'yaw', 'pitch', 'roll']:
-            if len(self.signal_history[channel]) > 100:
-                signals = list(self.signal_history[channel])
-                
-                # Signal power (variance of muscle activation periods)
-                signal_power = np.var(signals)
-                
-                # Noise power (variance during rest periods)
-                # Approximate rest periods as values near baseline
-                rest_threshold = self.baseline[channel] + 10
-                rest_values = [s for s in signals if s < rest_threshold]
-                
-                if len(rest_values) > 10:
-                    noise_power = np.var(rest_values)
-                    if noise_power > 0:
-                        snr_linear = signal_power / noise_power
-                        self.snr_values[channel] = 10 * math.log10(snr_linear) if snr_linear > 0 else 0
-                    else:
-                        self.snr_values[channel] = 50  # Very clean signal
-                else:
-                    self.snr_values[channel] = 0
+        if self._count <= 100:
+            return
+        
+        # Latest few seconds of every channel - enough for a stable noise estimate
+        signals = self._recent(slice(None), self.SNR_WINDOW)
+        
+        # Signal power (variance of muscle activation periods)
+        signal_power = signals.var(axis=1, dtype=np.float64)
+        
+        # Noise power from the median absolute deviation, scaled to a Gaussian sigma -
+        # robust to contraction bursts without picking out rest periods
+        median = np.median(signals, axis=1, keepdims=True)
+        mad = np.median(np.abs(signals - median), axis=1)
+        noise_power = (1.4826 * mad) ** 2
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            snr_db = 10 * np.log10(np.clip(signal_power / noise_power, 1e-12, None))
+        
+        # The array is the source of truth; snr_values stays as the by-name view.
+        # Both are rebound, never mutated, so readers on the main thread and reports
+        # already handed out only ever see a complete set of values
+        snr_db = np.where(noise_power > 0, snr_db, 50)  # 50 = very clean signal
+        self._snr_db = snr_db
+        self.snr_values = dict(zip(self.CHANNELS, snr_db.tolist()))
+        self._hud_dirty = True
     
     def calculate_crosstalk(self):
         """Calculate cross-talk between EMG channels"""
-        channels = ['throttle', 'yaw', 'pitch', 'roll']
-        
-        if all(len(self.signal_history[ch]) > 50 for ch in channels):
-            # Create correlation matrix
-            data_matrix = np.array([
-                list(self.signal_history[ch])[-50:] for ch in channels
-            ])
+        if self._count > 50:
+            # Pearson correlation from sums of products - no centred copies as in np.corrcoef
+            data_matrix = self._recent(slice(None), 50).astype(np.float64)
+            n = data_matrix.shape[1]
+            sums = data_matrix.sum(axis=1)
+            # Every pairwise sum of products in one einsum - no transposed copy - with the
+            # per-channel sums of squares on its diagonal
+            products = np.einsum('ik,jk->ij', data_matrix, data_matrix)
+            spread = n * np.diagonal(products) - sums * sums
             
-            correlation_matrix = np.corrcoef(data_matrix)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                correlation_matrix = (n * products - np.outer(sums, sums)) / np.sqrt(np.outer(spread, spread))
             
-            # Extract off-diagonal elements as crosstalk
-            for i in range(4):
-                for j in range(4):
-                    if i != j:
-                        self.crosstalk_matrix[i][j] = abs(correlation_matrix[i][j]) * 100
+            # Off-diagonal elements are the crosstalk - finished in a local and then
+            # swapped in, so no reader sees the diagonal before it is zeroed
+            crosstalk = np.abs(correlation_matrix)
+            crosstalk *= 100
+            np.fill_diagonal(crosstalk, 0)
+            self.crosstalk_matrix = crosstalk
+            self._hud_dirty = True
     
     def calibrate_baseline(self, duration_seconds=10):
         """
         Perform baseline calibration - user should be at rest
         Returns True when calibration is complete
         """
-        channels = ['throttle', 'yaw', 'pitch', 'roll']
-        
         # Collect baseline data
-        if all(len(self.signal_history[ch]) > duration_seconds * 10 for ch in channels):
-            for channel in channels:
-                recent_values = list(self.signal_history[channel])[-100:]
-                self.baseline[channel] = np.mean(recent_values)
+        if self._count > duration_seconds * 10:
+            # All four baselines from one reduction over the (channels, samples) window
+            baseline = self._recent(slice(None), 100).mean(axis=1, dtype=np.float64)
+            self.baseline.update(zip(self.CHANNELS, baseline.tolist()))
+            self._refresh_calibration_arrays()
             
             self.calibration_complete = True
+            self._hud_dirty = True
             print("EMG Baseline calibration complete:")
-            for channel in channels:
+            for channel in self.CHANNELS:
                 print(f"  {channel}: {self.baseline[channel]:.1f}")
             return True
         
@@ -181,9 +332,10 @@ class EMGEvaluationSystem:
         Calibrate maximum voluntary contraction for specific channel
         User should perform maximum contraction during this period
         """
-        if len(self.signal_history[channel]) > duration_seconds * 10:
-            recent_values = list(self.signal_history[channel])[-50:]
-            self.max_values[channel] = max(recent_values)
+        if self._count > duration_seconds * 10:
+            recent_values = self._recent(self.CHANNELS.index(channel), 50)
+            self.max_values[channel] = float(recent_values.max())
+            self._refresh_calibration_arrays()
             print(f"Maximum calibration for {channel}: {self.max_values[channel]:.1f}")
     
     def evaluate_signal_quality(self):
@@ -191,9 +343,13 @@ class EMGEvaluationSystem:
         if not self.calibration_complete:
             return "Not Calibrated"
         
+        # Metrics aren't kept current while analytics are off, so bring them up to date now
+        if not self.analytics_enabled:
+            self.calculate_snr()
+            self.calculate_crosstalk()
+        
         # Check SNR for all channels
-        min_snr = min(self.snr_values.values())
-        avg_snr = np.mean(list(self.snr_values.values()))
+        min_snr = self._snr_db.min()
         
         # Check crosstalk
         max_crosstalk = np.max(self.crosstalk_matrix)
@@ -222,34 +378,31 @@ class EMGEvaluationSystem:
                 control_error += abs(intended - 0.5)  # Placeholder calculation
         
         accuracy = max(0, 100 - (control_error * 100))
-        self.evaluation_results['control_accuracy'] = accuracy
+        if accuracy != self.evaluation_results['control_accuracy']:
+            self.evaluation_results['control_accuracy'] = accuracy
+            self._hud_dirty = True
         return accuracy
     
     def detect_fatigue(self):
         """Detect muscle fatigue based on signal characteristics"""
-        channels = ['throttle', 'yaw', 'pitch', 'roll']
-        fatigue_indicators = []
-        
-        for channel in channels:
-            if len(self.signal_history[channel]) > 500:
-                # Compare recent performance to earlier performance
-                early_signals = list(self.signal_history[channel])[:250]
-                recent_signals = list(self.signal_history[channel])[-250:]
-                
-                early_power = np.var(early_signals)
-                recent_power = np.var(recent_signals)
-                
-                if early_power > 0:
-                    power_ratio = recent_power / early_power
-                    fatigue_indicator = max(0, (1 - power_ratio) * 100)
-                    fatigue_indicators.append(fatigue_indicator)
-        
-        if fatigue_indicators:
-            avg_fatigue = np.mean(fatigue_indicators)
-            self.evaluation_results['fatigue_level'] = avg_fatigue
-            return avg_fatigue
+        if self._count <= 500:
+            return 0
+        
+        # Compare recent performance to earlier performance - (channel, early/recent) powers in one reduction
+        history = self._recent(slice(None), self._count)
+        powers = np.stack((history[:, :250], history[:, -250:]), axis=1).var(axis=2, dtype=np.float64)
+        early_power, recent_power = powers[:, 0], powers[:, 1]
         
-        return 0
+        active = early_power > 0
+        if not active.any():
+            return 0
+        
+        power_ratio = recent_power[active] / early_power[active]
+        avg_fatigue = float(np.maximum(0, (1 - power_ratio) * 100).mean())
+        if avg_fatigue != self.evaluation_results['fatigue_level']:
+            self.evaluation_results['fatigue_level'] = avg_fatigue
+            self._hud_dirty = True
+        return avg_fatigue
     
     def log_emg_data(self, raw_signals):
         """Log EMG data for offline analysis"""
@@ -262,11 +415,10 @@ class EMGEvaluationSystem:
         processed_signals = self.process_signals(raw_signals)
         
         # Get current metrics
-        snr_values = [self.snr_values[ch] for ch in ['throttle', 'yaw', 'pitch', 'roll']]
+        snr_values = self._snr_db.tolist()
         
-        # Write data row
-        writer = csv.writer(self.emg_log_file)
-        writer.writerow([
+        # Queue data row - rows reach the file in batches rather than one write per sample
+        self._row_buf.append((
             timestamp,
             *raw_signals,
             *processed_signals,
@@ -274,29 +426,28 @@ class EMGEvaluationSystem:
             self.evaluation_results['control_accuracy'],
             self.evaluation_results['response_latency'],
             self.evaluation_results['fatigue_level']
-        ])
+        ))
         
-        self.emg_log_file.flush()  # Ensure data is written
+        if len(self._row_buf) >= self.LOG_BATCH_ROWS:
+            self._flush_log_rows()
+    
+    def _flush_log_rows(self):
+        """Write any queued log rows to the log file"""
+        if self._row_buf:
+            if self._csv_writer is None:
+                np.array(self._row_buf, LOG_RECORD_DTYPE).tofile(self.emg_log_file)
+            else:
+                self._csv_writer.writerows(self._row_buf)
+            self._row_buf.clear()
     
     def process_signals(self, raw_signals):
         """Apply signal processing (placeholder - use your existing filters)"""
         # Apply your existing EMG filtering from drone.py
-        processed = []
-        for i, signal in enumerate(raw_signals):
-            # Subtract baseline
-            channel = ['throttle', 'yaw', 'pitch', 'roll'][i]
-            baseline_corrected = max(0, signal - self.baseline[channel])
-            
-            # Normalize to 0-1 range
-            if self.max_values[channel] > self.baseline[channel]:
-                normalized = baseline_corrected / (self.max_values[channel] - self.baseline[channel])
-                normalized = min(1.0, normalized)
-            else:
-                normalized = 0.0
-            
-            processed.append(normalized)
+        # Subtract baseline
+        baseline_corrected = np.maximum(0.0, np.asarray(raw_signals, np.float32) - self._baseline_arr)
         
-        return processed
+        # Normalize to 0-1 range
+        return np.minimum(1.0, baseline_corrected * self._inv_range_arr).tolist()
     
     def draw_evaluation_hud(self, screen, x=10, y=10):
         """Draw EMG evaluation HUD overlay - repositioned to avoid gauge overlap"""
@@ -305,75 +456,83 @@ class EMGEvaluationSystem:
         if not hasattr(self, 'arduino_connected') or not self.arduino_connected:
             return
         
+        if self._hud_dirty:
+            self._render_hud_text()
+        
         # MOVED POSITION: Place at top-right instead of top-left to avoid gauge overlap
-        panel_width = 280  # Reduced width
-        panel_height = 350  # Reduced height
+        panel_width = self.HUD_PANEL_SIZE[0]
         
         # Position at top-right corner, avoiding other HUD elements
         panel_x = screen.get_width() - panel_width - 10
         panel_y = 10
         
-        panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        panel_surface.fill((0, 0, 0, 180))
-        screen.blit(panel_surface, (panel_x, panel_y))
+        screen.blit(self._hud_panel, (panel_x, panel_y))
+        screen.blit(self._hud_text, (panel_x, panel_y))
+    
+    def _render_hud_text(self):
+        """Redraw the HUD panel text - only needed after a displayed metric changes"""
+        # Cleared before any value is read: an analytics update that lands mid-render
+        # sets it again and the next frame picks the new values up
+        self._hud_dirty = False
+        panel = self._hud_text
+        panel.fill((0, 0, 0, 0))
         
         # Title
-        title = self.font_medium.render("EMG Monitor", True, self.WHITE)  # Shorter title
-        screen.blit(title, (panel_x + 10, panel_y + 10))
+        title = self.render_text(self.font_medium, "EMG Monitor", self.WHITE)  # Shorter title
+        panel.blit(title, (10, 10))
         
-        current_y = panel_y + 35
+        current_y = 35
         
         # Signal Quality
         quality = self.evaluate_signal_quality()
         quality_color = self.GREEN if quality == "Excellent" else self.YELLOW if quality in ["Good", "Fair"] else self.RED
-        quality_text = self.font_small.render(f"Quality: {quality}", True, quality_color)
-        screen.blit(quality_text, (panel_x + 10, current_y))
+        quality_text = self.render_text(self.font_small, f"Quality: {quality}", quality_color)
+        panel.blit(quality_text, (10, current_y))
         current_y += 20
         
         # Compact SNR display
-        snr_text = self.font_small.render("SNR (dB):", True, self.WHITE)
-        screen.blit(snr_text, (panel_x + 10, current_y))
+        snr_text = self.render_text(self.font_small, "SNR (dB):", self.WHITE)
+        panel.blit(snr_text, (10, current_y))
         current_y += 18
         
         for channel in ['throttle', 'yaw', 'pitch', 'roll']:
             snr = self.snr_values[channel]
             snr_color = self.GREEN if snr > 20 else self.YELLOW if snr > 15 else self.RED
             short_name = channel[:3].upper()  # Shortened channel names
-            snr_display = self.font_small.render(f"{short_name}: {snr:.1f}", True, snr_color)
-            screen.blit(snr_display, (panel_x + 15, current_y))
+            snr_display = self.render_text(self.font_small, f"{short_name}: {snr:.1f}", snr_color)
+            panel.blit(snr_display, (15, current_y))
             current_y += 16
         
         # Compact metrics
         accuracy = self.evaluation_results['control_accuracy']
         acc_color = self.GREEN if accuracy > 90 else self.YELLOW if accuracy > 75 else self.RED
-        acc_text = self.font_small.render(f"Accuracy: {accuracy:.1f}%", True, acc_color)
-        screen.blit(acc_text, (panel_x + 10, current_y))
+        acc_text = self.render_text(self.font_small, f"Accuracy: {accuracy:.1f}%", acc_color)
+        panel.blit(acc_text, (10, current_y))
         current_y += 20
         
         fatigue = self.evaluation_results['fatigue_level']
         fatigue_color = self.GREEN if fatigue < 20 else self.YELLOW if fatigue < 40 else self.RED
-        fatigue_text = self.font_small.render(f"Fatigue: {fatigue:.1f}%", True, fatigue_color)
-        screen.blit(fatigue_text, (panel_x + 10, current_y))
+        fatigue_text = self.render_text(self.font_small, f"Fatigue: {fatigue:.1f}%", fatigue_color)
+        panel.blit(fatigue_text, (10, current_y))
     
     def generate_evaluation_report(self):
-        """Generate comprehensive evaluation report"""
-        report = {
-            'session_duration': time.time() - self.session_start_time,
-            'signal_quality': self.evaluate_signal_quality(),
-            'snr_values': self.snr_values.copy(),
-            'crosstalk_matrix': self.crosstalk_matrix.copy(),
-            'control_accuracy': self.evaluation_results['control_accuracy'],
-            'fatigue_level': self.evaluation_results['fatigue_level'],
-            'calibration_complete': self.calibration_complete,
-            'baseline_values': self.baseline.copy(),
-            'max_values': self.max_values.copy()
-        }
-        
-        return report
+        """Generate comprehensive evaluation report, copied so later updates don't change it"""
+        return EMGReport(
+            session_duration=time.time() - self.session_start_time,
+            signal_quality=self.evaluate_signal_quality(),
+            snr_values=self.snr_values.copy(),
+            crosstalk_matrix=self.crosstalk_matrix.copy(),
+            control_accuracy=self.evaluation_results['control_accuracy'],
+            fatigue_level=self.evaluation_results['fatigue_level'],
+            calibration_complete=self.calibration_complete,
+            baseline_values=self.baseline.copy(),
+            max_values=self.max_values.copy()
+        )
     
     def close_logging(self):
         """Close EMG logging file"""
         if self.emg_log_file:
+            self._flush_log_rows()
             self.emg_log_file.close()
             print("EMG evaluation logging stopped")
 
@@ -384,9 +543,9 @@ class EMGCalibrationUI:
     def __init__(self, screen_width, screen_height):
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 32)
-        self.font_small = pygame.font.Font(None, 24)
+        self.font_large = get_font(48)
+        self.font_medium = get_font(32)
+        self.font_small = get_font(24)
         
         self.WHITE = (255, 255, 255)
         self.GREEN = (0, 255, 0)
@@ -450,13 +609,13 @@ class EMGCalibrationUI:
             screen.blit(countdown_text, countdown_rect)
         
         # Current EMG values
-        if emg_eval.signal_history['throttle']:
+        if emg_eval.latest_signal('throttle') is not None:
             values_y = 450
             values_text = self.font_small.render("Current EMG Values:", True, self.WHITE)
             screen.blit(values_text, (self.screen_width//2 - 100, values_y))
             
             for i, channel in enumerate(['throttle', 'yaw', 'pitch', 'roll']):
-                if emg_eval.signal_history[channel]:
-                    value = emg_eval.signal_history[channel][-1]
+                value = emg_eval.latest_signal(channel)
+                if value is not None:
                     val_text = self.font_small.render(f"{channel}: {value:.1f}", True, self.BLUE)
                     screen.blit(val_text, (self.screen_width//2 - 100 + (i * 100), values_y + 25))
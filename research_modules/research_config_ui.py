@@ -1,5 +1,7 @@
 import pygame
+import functools
 from config import DebugConfig, EMGConfig
+from font_cache import get_font
 
 class ResearchConfigurationUI:
     """Simplified configuration UI focused on EMG research parameters"""
@@ -19,24 +21,31 @@ class ResearchConfigurationUI:
         self.ORANGE = (255, 165, 0)
         
         # Fonts
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 32)
-        self.font_small = pygame.font.Font(None, 24)
+        self.font_large = get_font(48)
+        self.font_medium = get_font(32)
+        self.font_small = get_font(24)
+        
+        # Rendered text keyed by (font, text, color) - the screen only changes on a keypress
+        self.render_text = functools.lru_cache(maxsize=128)(self._render_text)
+    
+    def _render_text(self, font, text, color):
+        """Render antialiased UI text (wrapped by the render_text LRU cache)"""
+        return font.render(text, True, color).convert_alpha()
     
     def draw_screen(self, screen, current_config):
-        """Draw the research configuration screen"""
+        """Draw the research configuration screen, returning its live regions (none - it is static)"""
         screen.fill((20, 30, 60))  # Dark blue background
         
         # Title
-        title = self.font_large.render("EMG Flight Control Research Platform", True, self.WHITE)
+        title = self.render_text(self.font_large, "EMG Flight Control Research Platform", self.WHITE)
         title_rect = title.get_rect(center=(self.screen_width//2, 60))
         screen.blit(title, title_rect)
         
-        subtitle = self.font_medium.render("BioAmp EXG Pill + Arduino Uno R4", True, self.YELLOW)
+        subtitle = self.render_text(self.font_medium, "BioAmp EXG Pill + Arduino Uno R4", self.YELLOW)
         subtitle_rect = subtitle.get_rect(center=(self.screen_width//2, 90))
         screen.blit(subtitle, subtitle_rect)
         
-        research_note = self.font_small.render("HardwareX Publication Platform - EMG Signal Validation", True, self.GRAY)
+        research_note = self.render_text(self.font_small, "HardwareX Publication Platform - EMG Signal Validation", self.GRAY)
         research_rect = research_note.get_rect(center=(self.screen_width//2, 115))
         screen.blit(research_note, research_rect)
         
@@ -56,10 +65,12 @@ class ResearchConfigurationUI:
         
         # Draw start section - MOVED DOWN MORE  
         self._draw_start_section(screen, left_col_x, 620, current_config)
+        
+        return []
     
     def _draw_flight_configuration(self, screen, x, y, config):
         """Draw flight performance parameters"""
-        flight_title = self.font_medium.render("Flight Parameters", True, self.WHITE)
+        flight_title = self.render_text(self.font_medium, "Flight Parameters", self.WHITE)
         screen.blit(flight_title, (x, y))
         
         speed_options = [
@@ -71,15 +82,15 @@ class ResearchConfigurationUI:
         for i, (option, speed, desc) in enumerate(speed_options):
             y_pos = y + 35 + i * 45
             color = self.GREEN if speed == config['max_speed_kmh'] else self.WHITE
-            option_text = self.font_small.render(option, True, color)
+            option_text = self.render_text(self.font_small, option, color)
             screen.blit(option_text, (x + 20, y_pos))
             
-            desc_text = self.font_small.render(desc, True, self.GRAY)
+            desc_text = self.render_text(self.font_small, desc, self.GRAY)
             screen.blit(desc_text, (x + 20, y_pos + 18))
         
         # Range options
         range_y = y + 170
-        range_title = self.font_medium.render("Flight Range", True, self.WHITE)
+        range_title = self.render_text(self.font_medium, "Flight Range", self.WHITE)
         screen.blit(range_title, (x, range_y))
         
         range_options = [
@@ -90,26 +101,26 @@ class ResearchConfigurationUI:
         for i, (option, range_val, desc) in enumerate(range_options):
             y_pos = range_y + 35 + i * 45
             color = self.GREEN if range_val == config['max_range_km'] else self.WHITE
-            option_text = self.font_small.render(option, True, color)
+            option_text = self.render_text(self.font_small, option, color)
             screen.blit(option_text, (x + 20, y_pos))
             
-            desc_text = self.font_small.render(desc, True, self.GRAY)
+            desc_text = self.render_text(self.font_small, desc, self.GRAY)
             screen.blit(desc_text, (x + 20, y_pos + 18))
     
     def _draw_emg_configuration(self, screen, x, y, config):
         """Draw EMG hardware settings"""
-        emg_title = self.font_medium.render("EMG Configuration", True, self.WHITE)
+        emg_title = self.render_text(self.font_medium, "EMG Configuration", self.WHITE)
         screen.blit(emg_title, (x, y))
         
         # Hardware status
         hardware_status = "Connected" if config.get('emg_connected', False) else "Simulated"
         status_color = self.GREEN if config.get('emg_connected', False) else self.YELLOW
-        status_text = self.font_small.render(f"Hardware Status: {hardware_status}", True, status_color)
+        status_text = self.render_text(self.font_small, f"Hardware Status: {hardware_status}", status_color)
         screen.blit(status_text, (x + 20, y + 30))
         
         # Channel mapping
         channel_y = y + 60
-        channel_title = self.font_small.render("EMG Channel Mapping:", True, self.WHITE)
+        channel_title = self.render_text(self.font_small, "EMG Channel Mapping:", self.WHITE)
         screen.blit(channel_title, (x + 20, channel_y))
         
         channels = [
@@ -120,33 +131,33 @@ class ResearchConfigurationUI:
         ]
         
         for i, channel in enumerate(channels):
-            channel_text = self.font_small.render(channel, True, self.BLUE)
+            channel_text = self.render_text(self.font_small, channel, self.BLUE)
             screen.blit(channel_text, (x + 40, channel_y + 25 + i * 20))
         
         # EMG settings
         settings_y = channel_y + 120
-        settings_title = self.font_small.render("Signal Processing:", True, self.WHITE)
+        settings_title = self.render_text(self.font_small, "Signal Processing:", self.WHITE)
         screen.blit(settings_title, (x + 20, settings_y))
         
-        threshold_text = self.font_small.render(f"Noise Threshold: {EMGConfig.NOISE_THRESHOLD}", True, self.GRAY)
+        threshold_text = self.render_text(self.font_small, f"Noise Threshold: {EMGConfig.NOISE_THRESHOLD}", self.GRAY)
         screen.blit(threshold_text, (x + 40, settings_y + 25))
         
-        sample_rate_text = self.font_small.render(f"Sample Rate: {EMGConfig.SAMPLE_RATE} Hz", True, self.GRAY)
+        sample_rate_text = self.render_text(self.font_small, f"Sample Rate: {EMGConfig.SAMPLE_RATE} Hz", self.GRAY)
         screen.blit(sample_rate_text, (x + 40, settings_y + 45))
         
         # Calibration reminder
         cal_y = settings_y + 80
-        cal_title = self.font_small.render("6 - Toggle EMG Logging", True, self.WHITE)
+        cal_title = self.render_text(self.font_small, "6 - Toggle EMG Logging", self.WHITE)
         logging_status = "ENABLED" if config.get('emg_logging', True) else "DISABLED"
         logging_color = self.GREEN if config.get('emg_logging', True) else self.RED
         
         screen.blit(cal_title, (x + 20, cal_y))
-        log_text = self.font_small.render(f"Data Logging: {logging_status}", True, logging_color)
+        log_text = self.render_text(self.font_small, f"Data Logging: {logging_status}", logging_color)
         screen.blit(log_text, (x + 40, cal_y + 20))
     
     def _draw_research_environment(self, screen, x, y, config):
         """Draw research environment information"""
-        env_title = self.font_medium.render("Research Environment", True, self.WHITE)
+        env_title = self.render_text(self.font_medium, "Research Environment", self.WHITE)
         screen.blit(env_title, (x, y))
         
         # Environment characteristics
@@ -160,12 +171,12 @@ class ResearchConfigurationUI:
         
         for i, feature in enumerate(env_features):
             color = self.GREEN if feature.startswith("*") else self.GRAY
-            feature_text = self.font_small.render(feature, True, color)
+            feature_text = self.render_text(self.font_small, feature, color)
             screen.blit(feature_text, (x + 20, y + 35 + i * 22))
         
         # Research objectives
         obj_y = y + 160
-        obj_title = self.font_small.render("Research Objectives:", True, self.YELLOW)
+        obj_title = self.render_text(self.font_small, "Research Objectives:", self.YELLOW)
         screen.blit(obj_title, (x + 20, obj_y))
         
         objectives = [
@@ -175,12 +186,12 @@ class ResearchConfigurationUI:
         ]
         
         for i, objective in enumerate(objectives):
-            obj_text = self.font_small.render(objective, True, self.WHITE)
+            obj_text = self.render_text(self.font_small, objective, self.WHITE)
             screen.blit(obj_text, (x + 40, obj_y + 25 + i * 20))
     
     def _draw_start_section(self, screen, x, y, config):
         """Draw configuration summary and start options"""
-        config_title = self.font_medium.render("Current Configuration:", True, self.YELLOW)
+        config_title = self.render_text(self.font_medium, "Current Configuration:", self.YELLOW)
         screen.blit(config_title, (x, y))
         
         config_items = [
@@ -191,7 +202,7 @@ class ResearchConfigurationUI:
         ]
         
         for i, item in enumerate(config_items):
-            item_text = self.font_small.render(item, True, self.WHITE)
+            item_text = self.render_text(self.font_small, item, self.WHITE)
             screen.blit(item_text, (x + 20, y + 30 + i * 20))
         
         # Start instructions - moved up slightly
@@ -204,14 +215,15 @@ class ResearchConfigurationUI:
             start_instruction = "ENTER - Start Simulation (Keyboard Mode)"
             start_color = self.YELLOW
         
-        start_text = self.font_medium.render(start_instruction, True, start_color)
+        start_text = self.render_text(self.font_medium, start_instruction, start_color)
         start_rect = start_text.get_rect(center=(self.screen_width//2, start_y))
         screen.blit(start_text, start_rect)
         
         # Controls reminder - reduced spacing
-        controls_text = self.font_small.render(
+        controls_text = self.render_text(
+            self.font_small,
             "Controls: WASD + Space + QE | R = Reset | ESC = Return to Config",
-            True, self.GRAY
+            self.GRAY
         )
         controls_rect = controls_text.get_rect(center=(self.screen_width//2, start_y + 25))  # Reduced from 35 to 25
         screen.blit(controls_text, controls_rect)
@@ -4,160 +4,255 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'core_systems'))
                                 
 from vector3 import Vector3
+from physics_manager import physics_manager
+from physics_jit import target_screen_radii
 from config import DebugConfig
-import math
+import numpy as np
+import pygame
+from enum import IntEnum
+
+class TargetType(IntEnum):
+    """Target kinds as small integers, resolved once from the scenario's type names"""
+    WAYPOINT = 0    # Basic navigation
+    CHECKPOINT = 1  # Research checkpoint
+    MARKER = 2      # Position marker
 
 class Target:
     """Simple navigation target for EMG research"""
     
+    __slots__ = ('position', 'radius', 'collected', 'target_type', 'type_id', 'color')
+    
+    # Color by target type, indexed by TargetType and shared by every instance
+    COLORS = (
+        (0, 255, 0),       # Green - basic navigation
+        (255, 215, 0),     # Gold - research checkpoint  
+        (0, 191, 255),     # Blue - position marker
+    )
+    
     def __init__(self, x, y, z, radius=20, target_type="waypoint"):
         self.position = Vector3(x, y, z)
         self.radius = radius
         self.collected = False
         self.target_type = target_type
-        self.color = self.get_color_by_type()
-        
-    def get_color_by_type(self):
-        """Get color based on target type"""
-        colors = {
-            "waypoint": (0, 255, 0),       # Green - basic navigation
-            "checkpoint": (255, 215, 0),   # Gold - research checkpoint  
-            "marker": (0, 191, 255),       # Blue - position marker
-        }
-        return colors.get(self.target_type, (0, 255, 0))
+        # Plain int so per-draw dict keys hash natively; unknown names draw as waypoints
+        self.type_id = int(TargetType.__members__.get(target_type.upper(), TargetType.WAYPOINT))
+        self.color = Target.COLORS[self.type_id]
         
     def check_collection(self, drone):
         """Check if drone has collected this target"""
         if self.collected:
             return False
             
-        distance = math.sqrt((drone.position.x - self.position.x)**2 + 
-                           (drone.position.y - self.position.y)**2 + 
-                           (drone.position.z - self.position.z)**2)
-        
-        if distance < (self.radius + drone.size/2):
+        drone_pos = drone.position
+        target_pos = self.position
+        if physics_manager.check_3d_collision_xyz(drone_pos.x, drone_pos.y, drone_pos.z,
+                                                  target_pos.x, target_pos.y, target_pos.z,
+                                                  self.radius, drone.size / 2):
             self.collected = True
             return True
         return False
 
+class TargetBatch:
+    """Structure-of-arrays view of scenario targets for vectorized collection checks"""
+    
+    def __init__(self, targets):
+        # Targets never move, so positions and radii are packed once per scenario
+        self.targets = list(targets)
+        self.positions = np.array(
+            [t.position.as_array() for t in self.targets], dtype=float
+        ).reshape(-1, 3)
+        self.radii = np.array([t.radius for t in self.targets], dtype=float)
+        self.collected = np.array([t.collected for t in self.targets], dtype=bool)
+        # Squared collection distances, rebuilt only when the drone size changes
+        self._reach_size = None
+        self._reach_sq = None
+    
+    def __len__(self):
+        return len(self.targets)
+    
+    def reach_sq(self, drone_size):
+        """Squared (radius + drone_size/2) per target, cached for the last drone size"""
+        if drone_size != self._reach_size:
+            self._reach_sq = (self.radii + drone_size / 2) ** 2
+            self._reach_size = drone_size
+        return self._reach_sq
+    
+    def mark_collected(self, index):
+        """Flag a target as collected in both the array and the Target object"""
+        self.collected[index] = True
+        self.targets[index].collected = True
+
+class TargetGrid:
+    """Uniform 3D spatial hash so only targets near the drone are tested"""
+    
+    def __init__(self, targets, drone_half_size=0.0, reach=60.0):
+        # Cells must be at least as wide as the largest collection distance: the 3D
+        # test accepts radius + drone half-size, crosshair collection up to reach
+        max_radius = max((t.radius for t in targets), default=0)
+        self.cell_size = max(max_radius + drone_half_size, reach)
+        self.cells = {}
+        
+        for index, target in enumerate(targets):
+            if not target.collected:
+                self.cells.setdefault(self._cell_of(target.position), []).append(index)
+        self.targets = list(targets)
+    
+    def _cell_of(self, position):
+        return (int(position.x // self.cell_size),
+                int(position.y // self.cell_size),
+                int(position.z // self.cell_size))
+    
+    def lookup(self, position):
+        """Indices of targets in the position's cell and its 26 neighbours, in scenario order"""
+        cx, cy, cz = self._cell_of(position)
+        candidates = []
+        
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    cell = self.cells.get((cx + dx, cy + dy, cz + dz))
+                    if cell:
+                        candidates.extend(cell)
+        
+        candidates.sort()
+        return np.array(candidates, dtype=int)
+    
+    def remove(self, target):
+        """Drop a collected target from its cell"""
+        key = self._cell_of(target.position)
+        cell = self.cells.get(key)
+        if cell:
+            cell[:] = [index for index in cell if self.targets[index] is not target]
+            if not cell:
+                del self.cells[key]
+
+# Target layouts as (x, y, z, radius, type) rows - fixed at import, only the
+# Target objects (which carry per-run collected state) are built per scenario
+BASIC_NAVIGATION_TARGETS = (
+    (200, 250, 0, 25, "checkpoint"),
+    (400, 200, 50, 25, "waypoint"),
+    (600, 250, -30, 25, "checkpoint"),
+    (800, 200, 20, 25, "waypoint"),
+)
+
+# Vertical navigation targets
+ALTITUDE_TEST_TARGETS = (
+    (200, 200, 0, 20, "marker"),    # Higher altitude
+    (400, 350, 0, 20, "marker"),    # Lower altitude
+    (600, 150, 0, 20, "marker"),    # High altitude
+    (800, 300, 0, 20, "marker"),    # Medium altitude
+)
+
+# Smaller, more precise targets
+PRECISION_TEST_TARGETS = (
+    (150, 250, 20, 15, "checkpoint"),
+    (350, 200, -20, 15, "checkpoint"),
+    (550, 280, 30, 15, "checkpoint"),
+    (750, 220, -10, 15, "checkpoint"),
+    (900, 260, 25, 15, "checkpoint"),
+)
+
+# Extended navigation course
+ENDURANCE_TEST_TARGETS = (
+    (150, 250, 0, 25, "waypoint"),
+    (300, 200, 40, 25, "waypoint"),
+    (450, 280, -30, 25, "waypoint"),
+    (600, 220, 50, 25, "waypoint"),
+    (750, 260, -20, 25, "waypoint"),
+    (900, 200, 30, 25, "waypoint"),
+    (1050, 250, 0, 25, "checkpoint"),  # Final target
+)
+
 class ResearchScenarioGenerator:
     """Generate simple scenarios for EMG research - no obstacles"""
     
+    @staticmethod
+    def _build_targets(layout):
+        """Fresh Target objects for a layout (optional based on config)"""
+        if DebugConfig.DISABLE_TARGETS:
+            return []
+        return [Target(*row) for row in layout]
+    
     @staticmethod
     def create_basic_navigation():
         """Basic waypoint navigation for EMG control validation"""
         # No obstacles in research mode
-        obstacles = []
-        
-        # Simple navigation targets (optional based on config)
-        if DebugConfig.DISABLE_TARGETS:
-            targets = []
-        else:
-            targets = [
-                Target(200, 250, 0, 25, "checkpoint"),
-                Target(400, 200, 50, 25, "waypoint"), 
-                Target(600, 250, -30, 25, "checkpoint"),
-                Target(800, 200, 20, 25, "waypoint")
-            ]
-        
-        return obstacles, targets, "EMG Navigation Research"
+        targets = ResearchScenarioGenerator._build_targets(BASIC_NAVIGATION_TARGETS)
+        return [], targets, "EMG Navigation Research"
     
     @staticmethod 
     def create_altitude_test():
         """Altitude control test for EMG throttle validation"""
-        obstacles = []
-        
-        if DebugConfig.DISABLE_TARGETS:
-            targets = []
-        else:
-            # Vertical navigation targets
-            targets = [
-                Target(200, 200, 0, 20, "marker"),    # Higher altitude
-                Target(400, 350, 0, 20, "marker"),    # Lower altitude  
-                Target(600, 150, 0, 20, "marker"),    # High altitude
-                Target(800, 300, 0, 20, "marker")     # Medium altitude
-            ]
-        
-        return obstacles, targets, "EMG Altitude Control Test"
+        targets = ResearchScenarioGenerator._build_targets(ALTITUDE_TEST_TARGETS)
+        return [], targets, "EMG Altitude Control Test"
     
     @staticmethod
     def create_precision_test():
         """Precision control test with smaller targets"""
-        obstacles = []
-        
-        if DebugConfig.DISABLE_TARGETS:
-            targets = []
-        else:
-            # Smaller, more precise targets
-            targets = [
-                Target(150, 250, 20, 15, "checkpoint"),
-                Target(350, 200, -20, 15, "checkpoint"),
-                Target(550, 280, 30, 15, "checkpoint"),
-                Target(750, 220, -10, 15, "checkpoint"),
-                Target(900, 260, 25, 15, "checkpoint")
-            ]
-        
-        return obstacles, targets, "EMG Precision Control Test"
+        targets = ResearchScenarioGenerator._build_targets(PRECISION_TEST_TARGETS)
+        return [], targets, "EMG Precision Control Test"
     
     @staticmethod
     def create_endurance_test():
         """Longer course for muscle fatigue research"""
-        obstacles = []
-        
-        if DebugConfig.DISABLE_TARGETS:
-            targets = []
-        else:
-            # Extended navigation course
-            targets = [
-                Target(150, 250, 0, 25, "waypoint"),
-                Target(300, 200, 40, 25, "waypoint"),
-                Target(450, 280, -30, 25, "waypoint"), 
-                Target(600, 220, 50, 25, "waypoint"),
-                Target(750, 260, -20, 25, "waypoint"),
-                Target(900, 200, 30, 25, "waypoint"),
-                Target(1050, 250, 0, 25, "checkpoint")  # Final target
-            ]
-        
-        return obstacles, targets, "EMG Endurance Research"
+        targets = ResearchScenarioGenerator._build_targets(ENDURANCE_TEST_TARGETS)
+        return [], targets, "EMG Endurance Research"
 
 # Simplified renderer for targets only
 class ResearchRenderer:
     """Minimal renderer for research targets"""
     
+    __slots__ = ('screen_width', 'screen_height', '_sprite_cache')
+    
     def __init__(self, screen_width, screen_height):
         self.screen_width = screen_width
         self.screen_height = screen_height
+        # Pre-rendered target sprites keyed by (radius, type_id); radius is clamped so this stays small
+        self._sprite_cache = {}
     
-    def draw_target(self, screen, target, projection_func, drone_position, drone_rotation):
-        """Draw research target with proper 3D projection"""
-        if target.collected:
-            return
-            
-        projection = projection_func(target.position, drone_position, drone_rotation)
-        if projection is None:
-            return
-            
-        screen_x, screen_y, depth = projection
+    def draw_targets_batch(self, screen, batch, screen_x, screen_y, depth, visible):
+        """Draw a TargetBatch from one batched projection (see PhysicsManager.project_points_to_screen)"""
+        # Cull collected, behind-camera and off-screen targets (50 px margin) in one pass
+        on_screen = (visible & ~batch.collected &
+                     (screen_x >= -50) & (screen_x <= self.screen_width + 50) &
+                     (screen_y >= -50) & (screen_y <= self.screen_height + 50))
+        indices = on_screen.nonzero()[0]
         
-        # Skip if off-screen
-        if (screen_x < -50 or screen_x > self.screen_width + 50 or 
-            screen_y < -50 or screen_y > self.screen_height + 50):
-            return
+        # Far to near so closer targets are painted on top
+        indices = indices[np.argsort(-depth[indices], kind='stable')]
+        radii = target_screen_radii(batch.radii[indices], depth[indices]).tolist()
+        screen_x = screen_x.tolist()
+        screen_y = screen_y.tolist()
         
-        # Scale with distance
-        base_radius = target.radius
-        distance_scale = max(0.3, 100.0 / max(10, depth))
-        scaled_radius = int(base_radius * distance_scale)
-        scaled_radius = max(5, min(50, scaled_radius))  # Clamp size
+        # Sprites are looked up in the loop, then handed to SDL in a single blits() call
+        targets = batch.targets
+        target_sprite = self._target_sprite
+        screen.blits([(target_sprite(targets[i], r), (screen_x[i] - r - 1, screen_y[i] - r - 1))
+                      for i, r in zip(indices.tolist(), radii)], doreturn=False)
+    
+    def _target_sprite(self, target, scaled_radius):
+        """Cached sprite for a target type at a screen radius"""
+        sprite = self._sprite_cache.get((scaled_radius, target.type_id))
+        if sprite is None:
+            sprite = self._build_target_sprite(scaled_radius, target.color)
+            self._sprite_cache[(scaled_radius, target.type_id)] = sprite
+        return sprite
+    
+    def _build_target_sprite(self, radius, color):
+        """Render one target (fill, outline, center dot) onto a transparent surface"""
+        circle = pygame.draw.circle
+        size = 2 * radius + 2
+        center = (radius + 1, radius + 1)
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
         
         # Draw target
-        import pygame
-        pygame.draw.circle(screen, target.color, (screen_x, screen_y), scaled_radius)
-        pygame.draw.circle(screen, (255, 255, 255), (screen_x, screen_y), scaled_radius, 2)
+        circle(sprite, color, center, radius)
+        circle(sprite, (255, 255, 255), center, radius, 2)
         
         # Draw center dot for precision
-        center_size = max(2, scaled_radius // 4)
-        pygame.draw.circle(screen, (255, 255, 255), (screen_x, screen_y), center_size)
+        center_size = max(2, radius // 4)
+        circle(sprite, (255, 255, 255), center, center_size)
+        return sprite.convert_alpha()
 
 # Research scenario mapping
 RESEARCH_SCENARIOS = {